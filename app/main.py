@@ -1,7 +1,7 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
 import plotly.graph_objects as go
+import plotly.io as pio
 import sys
 from pathlib import Path
 
@@ -13,7 +13,12 @@ from app.utils import (
     load_all_countries_data,
     load_data_from_uploaded_files,
     filter_data_by_countries,
-    create_summary_table
+    filter_data_by_date_range,
+    compute_daily_ghi,
+    compute_box_stats,
+    lttb_indices,
+    create_summary_table,
+    get_data_version
 )
 
 # Page configuration
@@ -85,6 +90,9 @@ if data_source == "Upload Files":
             with st.spinner("Loading uploaded data..."):
                 from app.utils import load_data_from_uploaded_files
                 df = load_data_from_uploaded_files(uploaded_files)
+                data_version = tuple(
+                    f.file_id for f in uploaded_files.values() if f is not None
+                )
                 st.sidebar.success(f"✅ Loaded {len(df):,} records")
         except Exception as e:
             st.error(f"❌ Error loading uploaded files: {str(e)}")
@@ -94,15 +102,21 @@ if data_source == "Upload Files":
         st.stop()
 
 else:  # Use Local Files
-    # Load data with caching
-    @st.cache_data
-    def load_data():
+    # Load data with caching. cache_resource shares the same in-memory
+    # dataframe across reruns and sessions instead of unpickling a copy on
+    # every hit; the key is the CSV modification times, not the data.
+    # Only the current version is kept, so a replaced file doesn't leave
+    # the old dataframe in memory.
+    @st.cache_resource(max_entries=1, hash_funcs={type(Path()): get_data_version})
+    def load_data(data_path: Path):
         """Load and cache the combined dataset."""
-        return load_all_countries_data()
+        return load_all_countries_data(data_path)
     
     # Load data (cached)
     try:
-        df = load_data()
+        data_path = Path('data')
+        df = load_data(data_path)
+        data_version = get_data_version(data_path)
         st.sidebar.success(f"✅ Loaded {len(df):,} records from local files")
     except FileNotFoundError as e:
         st.error(f"❌ Data Loading Error: {str(e)}")
@@ -121,19 +135,13 @@ else:  # Use Local Files
         )
         st.stop()
 
-if df is None or len(df) == 0:
+if df is None or len(df) == 0 or 'tmin' not in df.attrs:
     st.warning("⚠️ No data available. Please upload files or check local file paths.")
     st.stop()
 
-# Pre-compute date range for better performance
-# Recalculate if data changes (for uploaded files)
-if 'df_hash' not in st.session_state or st.session_state.df_hash != hash(str(df.shape) + str(df['Timestamp'].min()) + str(df['Timestamp'].max())):
-    st.session_state.min_date = df['Timestamp'].min().date()
-    st.session_state.max_date = df['Timestamp'].max().date()
-    st.session_state.df_hash = hash(str(df.shape) + str(df['Timestamp'].min()) + str(df['Timestamp'].max()))
-
-min_date = st.session_state.min_date
-max_date = st.session_state.max_date
+# Date range recorded by the loader (no scan of the Timestamp column)
+min_date = df.attrs['tmin'].date()
+max_date = df.attrs['tmax'].date()
 
 # Sidebar
 st.sidebar.header("📊 Filters")
@@ -162,24 +170,52 @@ date_range = st.sidebar.date_input(
     help="Filter data by date range"
 )
 
-# Filter data by countries first (more efficient)
-if selected_countries:
-    filtered_df = filter_data_by_countries(df, selected_countries)
-else:
+def df_view(df, countries_key, date_key):
+    """Slice the master dataframe for a (countries, date range) selection."""
+    if date_key is None:
+        return filter_data_by_countries(df, list(countries_key))
+    # Binary search on the sorted per-country Timestamp blocks instead of
+    # a full boolean mask
+    return filter_data_by_date_range(df, countries_key, *date_key)
+
+# Number of (countries, date range) selections cached per helper
+SELECTION_CACHE_ENTRIES = 32
+
+# Derived results are cached on small selection keys plus data_version, so
+# the dataframe itself is never hashed (leading underscore skips it).
+# Entries are bounded: one daily aggregate, and the most recent selections
+# from all sessions.
+@st.cache_resource(max_entries=1)
+def load_daily_ghi(_df, data_version):
+    """Compute and cache the daily GHI aggregate."""
+    return compute_daily_ghi(_df)
+
+@st.cache_resource(max_entries=SELECTION_CACHE_ENTRIES)
+def load_box_stats(_df, countries_key, date_key, data_version):
+    """Compute and cache the GHI/DNI/DHI boxplot statistics for a selection."""
+    return compute_box_stats(df_view(_df, countries_key, date_key))
+
+@st.cache_resource(max_entries=SELECTION_CACHE_ENTRIES)
+def load_summary_table(_df, countries_key, date_key, data_version):
+    """Compute and cache the summary table for a selection."""
+    return create_summary_table(df_view(_df, countries_key, date_key))
+
+if not selected_countries:
     st.warning("⚠️ Please select at least one country")
     st.stop()
-    filtered_df = df
 
-# Filter by date range if both dates selected (optimize with datetime comparison)
+countries_key = tuple(sorted(selected_countries))
+
+# Filter by date range if both dates selected
 if len(date_range) == 2:
     start_date, end_date = date_range
-    # Convert to datetime for faster comparison
     start_datetime = pd.Timestamp(start_date)
     end_datetime = pd.Timestamp(end_date) + pd.Timedelta(days=1)  # Include end date
-    filtered_df = filtered_df[
-        (filtered_df['Timestamp'] >= start_datetime) &
-        (filtered_df['Timestamp'] < end_datetime)
-    ]
+    date_key = (start_datetime, end_datetime)
+else:
+    date_key = None
+
+filtered_df = df_view(df, countries_key, date_key)
 
 # Main content area - Quick Stats
 col1, col2, col3 = st.columns(3)
@@ -202,53 +238,56 @@ color_map = {
     'Togo': '#e74c3c'
 }
 
-# Helper function to create boxplot (cached for performance)
-@st.cache_data
-def create_boxplot_cached(df, metric, title, y_label, color_map):
-    """Create a boxplot for the given metric (cached)."""
-    fig = px.box(
-        df,
-        x='Country',
-        y=metric,
-        color='Country',
-        title=title,
-        labels={metric: y_label, 'Country': 'Country'},
-        color_discrete_map=color_map
-    )
+# Maximum number of points sent to the browser per time-series trace
+MAX_TRACE_POINTS = 1000
+
+# Traces denser than this get no per-point hover (safety net in case the
+# downsampling limit is raised or bypassed)
+HOVER_POINT_LIMIT = 2000
+
+# Shared layout for the boxplots, registered once per process (this script
+# reruns on every interaction, the plotly template registry persists)
+if 'solar_box' not in pio.templates:
+    box_template = go.layout.Template(pio.templates[pio.templates.default])
+    box_template.layout.update(showlegend=False)
+    pio.templates['solar_box'] = box_template
+
+# Boxplots are drawn from per-country quartiles computed server-side, so
+# only five numbers per country are sent to the browser instead of every row
+def create_boxplot(metric_stats, title, y_label):
+    """Create a boxplot from precomputed per-country statistics."""
+    fig = go.Figure([
+        go.Box(
+            name=country,
+            x=[country],
+            q1=[row['q1']],
+            median=[row['median']],
+            q3=[row['q3']],
+            lowerfence=[row['lowerfence']],
+            upperfence=[row['upperfence']],
+            marker_color=color_map.get(country)
+        )
+        for country, row in metric_stats.iterrows()
+    ])
+    # Height stays on the figure itself: Streamlit sizes the chart container
+    # from layout.height, not from the template
     fig.update_layout(
-        showlegend=False,
-        height=500,
-        xaxis_title="Country",
-        yaxis_title=y_label
-    )
-    return fig
-
-# Non-cached version for dynamic updates
-def create_boxplot(df, metric, title, y_label):
-    """Create a boxplot for the given metric."""
-    fig = px.box(
-        df,
-        x='Country',
-        y=metric,
-        color='Country',
+        template='solar_box',
         title=title,
-        labels={metric: y_label, 'Country': 'Country'},
-        color_discrete_map=color_map
-    )
-    fig.update_layout(
-        showlegend=False,
         height=500,
         xaxis_title="Country",
         yaxis_title=y_label
     )
     return fig
 
+# Statistics for all three boxplots come from one grouped pass
+box_stats = load_box_stats(df, countries_key, date_key, data_version)
+
 # Tab 1: GHI Boxplot
 with tab1:
     st.header("📈 Global Horizontal Irradiance (GHI) Distribution")
     fig_ghi = create_boxplot(
-        filtered_df,
-        'GHI',
+        box_stats['GHI'],
         'Global Horizontal Irradiance (GHI) Distribution',
         'GHI (W/m²)'
     )
@@ -258,8 +297,7 @@ with tab1:
 with tab2:
     st.header("📈 Direct Normal Irradiance (DNI) Distribution")
     fig_dni = create_boxplot(
-        filtered_df,
-        'DNI',
+        box_stats['DNI'],
         'Direct Normal Irradiance (DNI) Distribution',
         'DNI (W/m²)'
     )
@@ -269,8 +307,7 @@ with tab2:
 with tab3:
     st.header("📈 Diffuse Horizontal Irradiance (DHI) Distribution")
     fig_dhi = create_boxplot(
-        filtered_df,
-        'DHI',
+        box_stats['DHI'],
         'Diffuse Horizontal Irradiance (DHI) Distribution',
         'DHI (W/m²)'
     )
@@ -280,29 +317,39 @@ with tab3:
 with tab4:
     st.header("📈 Daily Average GHI Over Time")
     
-    # Optimize: Use resample for daily aggregation (much faster)
-    if len(filtered_df) > 0:
-        # Create a copy to avoid SettingWithCopyWarning
-        ts_df = filtered_df[['Timestamp', 'Country', 'GHI']].copy()
-        ts_df.set_index('Timestamp', inplace=True)
-        
-        # Resample to daily and calculate mean (much faster than groupby)
-        daily_avg = ts_df.groupby('Country').resample('D')['GHI'].mean().reset_index()
-        
-        fig_time = px.line(
-            daily_avg,
-            x='Timestamp',
-            y='GHI',
-            color='Country',
-            title='Daily Average Global Horizontal Irradiance (GHI) Over Time',
-            labels={'GHI': 'Average GHI (W/m²)', 'Timestamp': 'Date'},
-            color_discrete_map=color_map
+    # Filter the precomputed daily aggregate instead of resampling raw data
+    daily_avg = load_daily_ghi(df, data_version)
+    daily_mask = daily_avg['Country'].isin(selected_countries)
+    if len(date_range) == 2:
+        daily_mask &= (
+            (daily_avg['Timestamp'] >= start_datetime) &
+            (daily_avg['Timestamp'] < end_datetime)
         )
+    daily_avg = daily_avg[daily_mask]
+    
+    if len(daily_avg) > 0:
+        # One WebGL trace per country, downsampled with LTTB so the browser
+        # never receives more than MAX_TRACE_POINTS points per line
+        fig_time = go.Figure()
+        for country, country_daily in daily_avg.groupby('Country', observed=True):
+            x = country_daily['Timestamp'].values
+            y = country_daily['GHI'].values
+            keep = lttb_indices(x, y, n_out=MAX_TRACE_POINTS)
+            fig_time.add_trace(go.Scattergl(
+                x=x[keep],
+                y=y[keep],
+                mode='lines',
+                name=country,
+                line=dict(color=color_map[country]),
+                hoverinfo='skip' if len(keep) > HOVER_POINT_LIMIT else 'x+y'
+            ))
         
         fig_time.update_layout(
+            title='Daily Average Global Horizontal Irradiance (GHI) Over Time',
             height=500,
             xaxis_title="Date",
             yaxis_title="Average GHI (W/m²)",
+            legend_title_text='Country',
             hovermode='x unified'
         )
         
@@ -312,7 +359,7 @@ with tab4:
 
 # Top Regions Table
 st.header("🏆 Top Regions by Average GHI")
-summary_table = create_summary_table(filtered_df)
+summary_table = load_summary_table(df, countries_key, date_key, data_version)
 
 # Display table
 st.dataframe(
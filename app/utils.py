@@ -1,8 +1,220 @@
+import os
+import tempfile
+
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.dataset as pads
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
+# Cleaned CSV file for each country, in display order
+COUNTRY_FILES = {
+    'Benin': 'benin_clean.csv',
+    'Sierra Leone': 'sierra_leone_clean.csv',
+    'Togo': 'togo_clean.csv'
+}
+
+COUNTRY_DTYPE = pd.CategoricalDtype(list(COUNTRY_FILES))
+
+# Combined cache written next to the cleaned CSVs
+PARQUET_CACHE_FILE = 'all_countries.parquet'
+
+# Columns used by the dashboard
+DASHBOARD_COLUMNS = ['Timestamp', 'Country', 'GHI', 'DNI', 'DHI']
+
+# Per-country statistics drawn by each boxplot
+BOX_STAT_COLUMNS = ['q1', 'median', 'q3', 'lowerfence', 'upperfence']
+
+# Irradiance columns are read directly as float32
+IRRADIANCE_DTYPES = {'GHI': 'float32', 'DNI': 'float32', 'DHI': 'float32'}
+
+# Sensor columns downcast to float32 after loading
+SENSOR_COLUMNS = ['GHI', 'DNI', 'DHI', 'ModA', 'ModB', 'Tamb', 'RH', 'WS', 'WSgust']
+
+
+def _read_clean_csv(source):
+    """
+    Read a cleaned CSV file with the multithreaded pyarrow parser.
+    
+    Args:
+        source: File path or file-like object (e.g. Streamlit UploadedFile)
+        
+    Returns:
+        DataFrame: Parsed data with Timestamp converted to datetime
+    """
+    return pd.read_csv(
+        source,
+        engine='pyarrow',
+        parse_dates=['Timestamp'],
+        cache_dates=True,
+        dtype=IRRADIANCE_DTYPES
+    )
+
+
+def _optimize_dtypes(df):
+    """
+    Shrink the combined dataframe in place: float32 sensor readings and
+    a categorical Country column.
+    
+    Args:
+        df: Combined dataframe with Country column
+        
+    Returns:
+        DataFrame: The same dataframe with compact dtypes
+    """
+    for col in SENSOR_COLUMNS:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], downcast='float')
+    
+    df['Country'] = df['Country'].astype(COUNTRY_DTYPE)
+    return df
+
+
+def _block_offsets(df):
+    """
+    Compute the row range of each country in a dataframe sorted by Country.
+    
+    Args:
+        df: Dataframe sorted by its categorical Country column
+        
+    Returns:
+        dict: Country name -> (start, end) row positions
+    """
+    countries = df['Country'].cat
+    counts = np.bincount(countries.codes.values, minlength=len(countries.categories))
+    ends = np.cumsum(counts)
+    return {
+        country: (int(end - count), int(end))
+        for country, count, end in zip(countries.categories, counts, ends)
+        if count > 0
+    }
+
+
+def _index_by_country(df):
+    """
+    Sort the combined dataframe by Country then Timestamp and record the
+    row range of each country in ``df.attrs['country_offsets']`` and the
+    overall time span in ``df.attrs['tmin']`` / ``df.attrs['tmax']``.
+    
+    Contiguous, time-ordered country blocks let date filters locate their
+    bounds with a binary search instead of scanning every row.
+    
+    Args:
+        df: Combined dataframe with categorical Country column
+        
+    Returns:
+        DataFrame: Sorted dataframe with a fresh RangeIndex
+    """
+    df = df.sort_values(['Country', 'Timestamp'], kind='mergesort', ignore_index=True)
+    df.attrs['country_offsets'] = _block_offsets(df)
+    
+    # Each country block is time-ordered with missing timestamps last, so
+    # the overall bounds are found among the first and last timestamped
+    # rows of the blocks
+    timestamps = df['Timestamp'].values
+    firsts, lasts = [], []
+    for lo, hi in df.attrs['country_offsets'].values():
+        hi = lo + np.count_nonzero(~np.isnat(timestamps[lo:hi]))
+        if hi > lo:
+            firsts.append(timestamps[lo])
+            lasts.append(timestamps[hi - 1])
+    if firsts:
+        df.attrs['tmin'] = pd.Timestamp(min(firsts))
+        df.attrs['tmax'] = pd.Timestamp(max(lasts))
+    return df
+
+
+def _read_uploaded_csv(source, convert_options):
+    """
+    Read an uploaded CSV file into an Arrow table.
+    
+    ISO timestamps are typed by the pyarrow reader; other formats (e.g.
+    ``08/09/2021 00:01``) are read as text and parsed with pandas.
+    
+    Args:
+        source: File-like object (e.g. Streamlit UploadedFile)
+        convert_options: pyarrow ConvertOptions typing the Timestamp column
+        
+    Returns:
+        pyarrow.Table: Parsed data with Timestamp converted to datetime
+    """
+    try:
+        return pacsv.read_csv(source, convert_options=convert_options)
+    except pa.ArrowInvalid:
+        source.seek(0)
+    
+    column_types = dict(convert_options.column_types)
+    column_types.pop('Timestamp')
+    table = pacsv.read_csv(
+        source,
+        convert_options=pacsv.ConvertOptions(column_types=column_types)
+    )
+    timestamps = pd.to_datetime(table.column('Timestamp').to_pandas(), cache=True)
+    return table.set_column(
+        table.schema.get_field_index('Timestamp'),
+        'Timestamp',
+        pa.Array.from_pandas(timestamps)
+    )
+
+
+def _offsets_match(df, offsets):
+    """
+    Check that recorded country offsets still describe a dataframe.
+    
+    pandas copies ``attrs`` into reordered frames (``sort_values``,
+    ``sample``, ...), so the rows must still be grouped by country in
+    category order, with each block sorted by Timestamp and its missing
+    timestamps last. One vectorized pass over the codes and timestamps.
+    
+    Args:
+        df: Dataframe with categorical Country column
+        offsets: Dict of country -> (start, end) to check
+        
+    Returns:
+        bool: True if the offsets can be used to slice df
+    """
+    codes = df['Country'].cat.codes.values
+    if len(codes) > 0 and (codes[0] < 0 or np.any(codes[1:] < codes[:-1])):
+        return False
+    if offsets != _block_offsets(df):
+        return False
+    
+    timestamps = df['Timestamp'].values
+    missing = np.isnat(timestamps)
+    for lo, hi in offsets.values():
+        n_valid = hi - lo - np.count_nonzero(missing[lo:hi])
+        if missing[lo:lo + n_valid].any():
+            return False
+        if np.any(timestamps[lo + 1:lo + n_valid] < timestamps[lo:lo + n_valid - 1]):
+            return False
+    return True
+
+
+def _country_offsets(df):
+    """
+    Get the per-country row ranges recorded by ``_index_by_country``.
+    
+    Frames whose offsets are missing or no longer match their rows (e.g.
+    filtered or reordered frames) are sorted by Country and Timestamp
+    first, keeping their index.
+    
+    Args:
+        df: Combined dataframe with categorical Country column
+        
+    Returns:
+        tuple: (dataframe the offsets refer to, dict of country -> (start, end))
+    """
+    offsets = df.attrs.get('country_offsets')
+    if offsets is None or not _offsets_match(df, offsets):
+        df = df.sort_values(['Country', 'Timestamp'], kind='mergesort')
+        offsets = _block_offsets(df)
+    return df, offsets
+
+
 def load_data_from_uploaded_files(uploaded_files_dict):
     """
     Load data from uploaded file objects.
@@ -14,7 +226,7 @@ def load_data_from_uploaded_files(uploaded_files_dict):
     Returns:
         DataFrame: Combined dataset with Country column
     """
-    dataframes = []
+    tables = []
     
     country_mapping = {
         'benin': 'Benin',
@@ -22,32 +234,168 @@ def load_data_from_uploaded_files(uploaded_files_dict):
         'togo': 'Togo'
     }
     
+    convert_options = pacsv.ConvertOptions(column_types={
+        'Timestamp': pa.timestamp('ns'),
+        **{col: pa.float32() for col in IRRADIANCE_DTYPES}
+    })
+    country_names = pa.array(list(COUNTRY_FILES))
+    
     for key, country_name in country_mapping.items():
         if key in uploaded_files_dict and uploaded_files_dict[key] is not None:
-            # Read uploaded file
-            df = pd.read_csv(
-                uploaded_files_dict[key],
-                parse_dates=['Timestamp'],
-                infer_datetime_format=True
+            # Read uploaded file straight into an Arrow table
+            table = _read_uploaded_csv(uploaded_files_dict[key], convert_options)
+            # Country as a dictionary column sharing one dictionary across files
+            country_code = COUNTRY_DTYPE.categories.get_loc(country_name)
+            codes = np.full(table.num_rows, country_code, dtype=np.int8)
+            table = table.append_column(
+                'Country',
+                pa.DictionaryArray.from_arrays(codes, country_names)
             )
-            df['Country'] = country_name
-            dataframes.append(df)
+            tables.append(table)
     
-    if not dataframes:
+    if not tables:
         raise ValueError("No data files uploaded. Please upload at least one CSV file.")
     
-    # Combine all datasets
-    all_countries_df = pd.concat(dataframes, ignore_index=True)
-    return all_countries_df
+    # Combine all datasets in Arrow and convert to pandas only once. A
+    # column inferred as int64 in one file and double in another is
+    # widened, as pd.concat would
+    combined = pa.concat_tables(tables, promote_options='permissive')
+    all_countries_df = combined.to_pandas()
+    return _index_by_country(_optimize_dtypes(all_countries_df))
+
+
+def get_data_version(data_dir='data'):
+    """
+    Identify the current contents of the data directory by the
+    modification times of the cleaned CSV files.
+    
+    Used as a cheap cache key: it changes whenever a source file is
+    replaced, without hashing any data.
+    
+    Args:
+        data_dir: Directory containing cleaned CSV files
+        
+    Returns:
+        tuple: Modification time (ns) of each CSV, None for missing files
+    """
+    data_path = Path(data_dir)
+    version = []
+    for file in COUNTRY_FILES.values():
+        file_path = data_path / file
+        version.append(file_path.stat().st_mtime_ns if file_path.exists() else None)
+    return tuple(version)
+
+
+def _read_country_csvs(data_path):
+    """
+    Read the cleaned CSV files and combine them into one dataframe.
+    
+    Args:
+        data_path: Path to the directory containing cleaned CSV files
+        
+    Returns:
+        DataFrame: Combined dataset with compact dtypes and Country column
+    """
+    csv_paths = [data_path / file for file in COUNTRY_FILES.values()]
+    
+    try:
+        # The three files are parsed concurrently (the pyarrow reader
+        # releases the GIL)
+        with ThreadPoolExecutor(max_workers=len(csv_paths)) as executor:
+            dataframes = list(executor.map(_read_clean_csv, csv_paths))
+    except Exception as e:
+        raise FileNotFoundError(
+            f"Error loading data files: {str(e)}. "
+            "Please ensure the CSV files are accessible and properly formatted."
+        ) from e
+    
+    for country_name, df in zip(COUNTRY_FILES, dataframes):
+        df['Country'] = country_name
+    
+    return _optimize_dtypes(pd.concat(dataframes, ignore_index=True))
+
+
+def _write_parquet_cache(df, cache_path):
+    """
+    Write the combined dataframe to the Parquet cache atomically.
+    
+    The file is written under a temporary name and renamed into place, so
+    a crash or a concurrent writer never leaves a partial cache behind.
+    
+    Args:
+        df: Combined dataframe
+        cache_path: Path of the Parquet cache file
+        
+    Returns:
+        bool: True if the cache was written, False if it could not be
+            (e.g. read-only data directory)
+    """
+    try:
+        fd, tmp_name = tempfile.mkstemp(
+            dir=cache_path.parent, prefix=f'.{cache_path.name}.', suffix='.tmp'
+        )
+    except OSError:
+        return False
+    os.close(fd)
+    
+    try:
+        df.to_parquet(tmp_name, compression='zstd', index=False)
+        os.replace(tmp_name, cache_path)
+    except OSError:
+        Path(tmp_name).unlink(missing_ok=True)
+        return False
+    return True
+
+
+def _ensure_parquet_cache(data_path):
+    """
+    Build (or refresh) the combined Parquet cache from the cleaned CSV files.
+    
+    The cache is rebuilt only when it is missing, unreadable or older than
+    any of the source CSVs, so subsequent cold starts skip CSV parsing
+    entirely. If the cache can't be written, the combined data is served
+    from memory instead.
+    
+    Args:
+        data_path: Path to the directory containing cleaned CSV files
+        
+    Returns:
+        pyarrow.dataset.Dataset: Dataset over the Parquet cache, or over
+            the combined data in memory
+    """
+    cache_path = data_path / PARQUET_CACHE_FILE
+    csv_paths = [data_path / file for file in COUNTRY_FILES.values()]
+    
+    if cache_path.exists():
+        newest_csv = max(path.stat().st_mtime for path in csv_paths)
+        if cache_path.stat().st_mtime >= newest_csv:
+            try:
+                return pads.dataset(cache_path, format='parquet')
+            except pa.ArrowInvalid:
+                pass  # Corrupt cache: rebuilt below
+    
+    all_countries_df = _read_country_csvs(data_path)
+    
+    if _write_parquet_cache(all_countries_df, cache_path):
+        return pads.dataset(cache_path, format='parquet')
+    return pads.dataset(pa.Table.from_pandas(all_countries_df, preserve_index=False))
 
 
-def load_all_countries_data(data_dir='data'):
+def load_all_countries_data(data_dir='data', columns=DASHBOARD_COLUMNS,
+                            start_datetime=None, end_datetime=None):
     """
     Load all cleaned country datasets and combine them.
-    Optimized for performance.
+    Optimized for performance: the CSVs are converted once into a
+    Parquet cache, which is then scanned with column pruning and an
+    optional time-window filter so unused columns and rows never reach
+    pandas.
     
     Args:
         data_dir: Directory containing cleaned CSV files
+        columns: Columns to load (None loads every column); Timestamp and
+            Country are always included
+        start_datetime: Optional inclusive lower bound on Timestamp
+        end_datetime: Optional exclusive upper bound on Timestamp
         
     Returns:
         DataFrame: Combined dataset with Country column
@@ -65,16 +413,9 @@ def load_all_countries_data(data_dir='data'):
             "For Streamlit Cloud deployment, data files must be in the repository."
         )
     
-    # List of required files
-    required_files = [
-        'benin_clean.csv',
-        'sierra_leone_clean.csv',
-        'togo_clean.csv'
-    ]
-    
     # Check if all required files exist
     missing_files = []
-    for file in required_files:
+    for file in COUNTRY_FILES.values():
         file_path = data_path / file
         if not file_path.exists():
             missing_files.append(file)
@@ -86,44 +427,25 @@ def load_all_countries_data(data_dir='data'):
             "For deployment, data files must be committed to the repository."
         )
     
-    # Load each country's cleaned CSV with optimized parsing
-    try:
-        benin_df = pd.read_csv(
-            data_path / 'benin_clean.csv',
-            parse_dates=['Timestamp'],
-            infer_datetime_format=True
-        )
-        sierra_leone_df = pd.read_csv(
-            data_path / 'sierra_leone_clean.csv',
-            parse_dates=['Timestamp'],
-            infer_datetime_format=True
-        )
-        togo_df = pd.read_csv(
-            data_path / 'togo_clean.csv',
-            parse_dates=['Timestamp'],
-            infer_datetime_format=True
-        )
-    except Exception as e:
-        raise FileNotFoundError(
-            f"Error loading data files: {str(e)}. "
-            "Please ensure the CSV files are accessible and properly formatted."
-        ) from e
+    dataset = _ensure_parquet_cache(data_path)
     
-    # Add country identifier before concatenation (more efficient)
-    benin_df['Country'] = 'Benin'
-    sierra_leone_df['Country'] = 'Sierra Leone'
-    togo_df['Country'] = 'Togo'
+    # Push the column projection and time window down into the Parquet scan
+    row_filter = None
+    if start_datetime is not None:
+        row_filter = pc.field('Timestamp') >= pd.Timestamp(start_datetime)
+    if end_datetime is not None:
+        end_filter = pc.field('Timestamp') < pd.Timestamp(end_datetime)
+        row_filter = end_filter if row_filter is None else row_filter & end_filter
     
-    # Combine all datasets (more efficient than multiple concats)
-    all_countries_df = pd.concat(
-        [benin_df, sierra_leone_df, togo_df], 
-        ignore_index=True
-    )
+    # Timestamp and Country are always needed to index the result
+    if columns is not None:
+        columns = list(dict.fromkeys(['Timestamp', 'Country', *columns]))
     
-    # Set Timestamp as index for faster date filtering (optional optimization)
-    # all_countries_df.set_index('Timestamp', inplace=True)
+    table = dataset.to_table(columns=columns, filter=row_filter)
+    all_countries_df = table.to_pandas()
+    all_countries_df['Country'] = all_countries_df['Country'].astype(COUNTRY_DTYPE)
     
-    return all_countries_df
+    return _index_by_country(all_countries_df)
 
 
 def filter_data_by_countries(df, selected_countries):
@@ -140,47 +462,297 @@ def filter_data_by_countries(df, selected_countries):
     if not selected_countries:
         return df
     
-    return df[df['Country'].isin(selected_countries)]
+    # Gather a per-category lookup table with the integer category codes
+    # instead of hashing country strings. The extra trailing slot is hit by
+    # code -1 (missing Country) and stays False.
+    countries = df['Country'].cat
+    selected_codes = countries.categories.get_indexer(selected_countries)
+    lookup = np.zeros(len(countries.categories) + 1, dtype=bool)
+    lookup[selected_codes[selected_codes >= 0]] = True
+    filtered = df[lookup[countries.codes.values]]
+    # The row offsets and time span describe the full frame only
+    filtered.attrs = {}
+    return filtered
 
 
-def create_summary_table(df):
+def filter_data_by_date_range(df, selected_countries, start_datetime, end_datetime):
     """
-    Create summary statistics table for top regions.
+    Filter dataframe by selected countries and a [start, end) time window.
+    
+    Relies on the per-country row offsets recorded at load time: each
+    country block is sorted by Timestamp, so the window bounds are found
+    with ``np.searchsorted`` and taken as zero-copy slices. Frames without
+    valid offsets are sorted and indexed first.
+    
+    Args:
+        df: Combined dataframe as returned by the loaders
+        selected_countries: List of country names to include
+        start_datetime: Inclusive lower bound (pd.Timestamp)
+        end_datetime: Exclusive upper bound (pd.Timestamp)
+        
+    Returns:
+        DataFrame: Filtered dataframe
+    """
+    df, offsets = _country_offsets(df)
+    timestamps = df['Timestamp'].values
+    start = start_datetime.to_datetime64()
+    end = end_datetime.to_datetime64()
+    
+    parts = []
+    for country in selected_countries:
+        if country not in offsets:
+            continue
+        lo, hi = offsets[country]
+        ts = timestamps[lo:hi]
+        a = np.searchsorted(ts, start, side='left')
+        b = np.searchsorted(ts, end, side='left')
+        parts.append(df.iloc[lo + a:lo + b])
+    
+    filtered = pd.concat(parts, copy=False) if parts else df.iloc[:0]
+    # The row offsets and time span describe the full frame only
+    filtered.attrs = {}
+    return filtered
+
+
+def compute_daily_ghi(df):
+    """
+    Aggregate GHI to daily means per country.
+    
+    Computed once per dataset so the time-series view only has to filter
+    a small daily frame instead of resampling minute-level data on every
+    interaction. Works directly on the sorted per-country blocks recorded
+    by the loaders: each block's day boundaries are found with
+    ``np.diff`` and reduced with ``np.add.reduceat``, without copying the
+    frame or building a DatetimeIndex. Days without data are NaN and rows
+    without a timestamp are skipped, as with ``resample('D')``.
+    
+    Args:
+        df: Combined dataframe as returned by the loaders
+        
+    Returns:
+        DataFrame: Columns Country, Timestamp (day) and GHI (daily mean)
+    """
+    df, offsets = _country_offsets(df)
+    timestamps = df['Timestamp'].values
+    ghi = df['GHI'].values
+    
+    parts = []
+    for country, (lo, hi) in offsets.items():
+        # Missing timestamps sort to the end of the block and are skipped,
+        # as resample does
+        hi = lo + np.count_nonzero(~np.isnat(timestamps[lo:hi]))
+        if hi == lo:
+            continue
+        day_id = timestamps[lo:hi].astype('datetime64[D]')
+        starts = np.r_[0, np.flatnonzero(np.diff(day_id)) + 1]
+        
+        values = ghi[lo:hi]
+        valid = ~np.isnan(values)
+        sums = np.add.reduceat(np.where(valid, values, 0.0), starts, dtype=np.float64)
+        counts = np.add.reduceat(valid, starts, dtype=np.int64)
+        
+        days = day_id[starts]
+        all_days = np.arange(days[0], days[-1] + 1)
+        means = np.full(len(all_days), np.nan)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            means[(days - days[0]).astype(np.int64)] = sums / counts
+        
+        parts.append(pd.DataFrame({
+            'Country': country,
+            'Timestamp': all_days.astype(timestamps.dtype),
+            'GHI': means
+        }))
+    
+    if not parts:
+        return pd.DataFrame({
+            'Country': pd.Series(dtype=COUNTRY_DTYPE),
+            'Timestamp': pd.Series(dtype=timestamps.dtype),
+            'GHI': pd.Series(dtype=np.float64)
+        })
+    
+    daily = pd.concat(parts, ignore_index=True)
+    daily['Country'] = daily['Country'].astype(COUNTRY_DTYPE)
+    return daily
+
+
+def compute_box_stats(df, metrics=('GHI', 'DNI', 'DHI')):
+    """
+    Compute per-country boxplot statistics for several metrics at once.
+    
+    The quartiles and fences of all metrics come from a single grouped
+    pass, so every boxplot can be drawn from a handful of numbers instead
+    of serializing the filtered rows once per figure.
     
     Args:
         df: Filtered dataframe
+        metrics: Columns to summarize
         
     Returns:
-        DataFrame: Summary table with statistics by country
+        dict: Metric name -> DataFrame indexed by Country with columns
+            q1, median, q3, lowerfence, upperfence
     """
-    summary = df.groupby('Country').agg({
-        'GHI': ['mean', 'median', 'std'],
-        'DNI': ['mean', 'median', 'std'],
-        'DHI': ['mean', 'median', 'std'],
-        'Timestamp': ['min', 'max', 'count']
-    }).round(2)
-    
-    # Flatten column names
-    summary.columns = [
-        'GHI_Mean', 'GHI_Median', 'GHI_Std',
-        'DNI_Mean', 'DNI_Median', 'DNI_Std',
-        'DHI_Mean', 'DHI_Median', 'DHI_Std',
-        'Date_Min', 'Date_Max', 'Record_Count'
-    ]
+    grouped = df.groupby('Country', observed=True)[list(metrics)]
+    lower, upper = grouped.min(), grouped.max()
     
-    # Sort by average GHI (descending)
-    summary = summary.sort_values('GHI_Mean', ascending=False)
+    # An empty selection has no quartile columns to unstack
+    if len(lower) == 0:
+        return {
+            metric: pd.DataFrame(columns=BOX_STAT_COLUMNS, index=lower.index, dtype=np.float64)
+            for metric in metrics
+        }
+    
+    quartiles = grouped.quantile([0.25, 0.5, 0.75])
     
-    # Reset index to make Country a column
-    summary = summary.reset_index()
+    box_stats = {}
+    for metric in metrics:
+        metric_quartiles = quartiles[metric].unstack()
+        box_stats[metric] = pd.DataFrame({
+            'q1': metric_quartiles[0.25],
+            'median': metric_quartiles[0.5],
+            'q3': metric_quartiles[0.75],
+            'lowerfence': lower[metric],
+            'upperfence': upper[metric]
+        })
+    return box_stats
+
+
+def lttb_indices(x, y, n_out=1000):
+    """
+    Select the points of a line trace to keep with the
+    Largest-Triangle-Three-Buckets (LTTB) downsampling algorithm.
+    
+    The first and last points are always kept; every bucket in between
+    contributes the point forming the largest triangle with the previously
+    selected point and the average of the next bucket, which preserves the
+    visual shape of the line. NaN values are ignored when downsampling.
+    
+    Args:
+        x: 1-D array of x values (numeric or datetime64), sorted ascending
+        y: 1-D array of y values
+        n_out: Maximum number of points to keep
+        
+    Returns:
+        ndarray: Sorted integer positions into x/y of the points to plot
+    """
+    y = np.asarray(y, dtype=np.float64)
+    valid = np.flatnonzero(~np.isnan(y))
+    n = len(valid)
+    if n <= n_out or n_out < 3:
+        return np.arange(len(y))
+    
+    x = np.asarray(x)
+    if np.issubdtype(x.dtype, np.datetime64):
+        x = x.view(np.int64)
+    x = x[valid].astype(np.float64)
+    y = y[valid]
+    
+    # n_out - 2 buckets spread over the interior points 1 .. n-2
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+    
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            next_lo, next_hi = edges[i + 1], edges[i + 2]
+        else:
+            next_lo, next_hi = n - 1, n
+        cx = x[next_lo:next_hi].mean()
+        cy = y[next_lo:next_hi].mean()
+        
+        area = np.abs(
+            (x[a] - cx) * (y[lo:hi] - y[a]) -
+            (x[a] - x[lo:hi]) * (cy - y[a])
+        )
+        a = lo + int(np.argmax(area))
+        selected[i + 1] = a
     
-    # Rename columns for display
-    summary.columns = [
+    return valid[selected]
+
+
+def create_summary_table(df):
+    """
+    Create summary statistics table for top regions.
+    
+    The statistics are computed in one pass per metric over contiguous
+    country blocks (``np.add.reduceat``) rather than through a nine-way
+    ``groupby().agg``.
+    
+    Args:
+        df: Filtered dataframe
+        
+    Returns:
+        DataFrame: Summary table with statistics by country
+    """
+    columns = [
         'Country',
         'Avg GHI (W/m²)', 'Median GHI (W/m²)', 'Std Dev GHI',
         'Avg DNI (W/m²)', 'Median DNI (W/m²)', 'Std Dev DNI',
         'Avg DHI (W/m²)', 'Median DHI (W/m²)', 'Std Dev DHI',
         'Start Date', 'End Date', 'Records'
     ]
+    if len(df) == 0:
+        return pd.DataFrame(columns=columns)
+    
+    countries = df['Country'].cat
+    codes = countries.codes.values
+    
+    # Group rows by country; loaded data is already sorted so this is a no-op
+    order = None
+    if np.any(codes[1:] < codes[:-1]):
+        order = np.argsort(codes, kind='stable')
+        codes = codes[order]
+    
+    starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+    ends = np.r_[starts[1:], len(codes)]
+    
+    def grouped(col):
+        values = df[col].values
+        return values if order is None else values[order]
+    
+    summary = {'Country': countries.categories[codes[starts]]}
+    
+    for metric in ('GHI', 'DNI', 'DHI'):
+        values = grouped(metric).astype(np.float64)
+        valid = ~np.isnan(values)
+        filled = np.where(valid, values, 0.0)
+        
+        counts = np.add.reduceat(valid, starts).astype(np.float64)
+        sums = np.add.reduceat(filled, starts)
+        sumsq = np.add.reduceat(filled * filled, starts)
+        
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = sums / counts
+            var = (sumsq - counts * mean * mean) / (counts - 1)
+        
+        summary[f'Avg {metric} (W/m²)'] = mean
+        # np.median selects the middle elements with np.partition per block
+        medians = []
+        for lo, hi in zip(starts, ends):
+            block = values[lo:hi][valid[lo:hi]]
+            medians.append(np.median(block) if len(block) else np.nan)
+        
+        summary[f'Median {metric} (W/m²)'] = medians
+        summary[f'Std Dev {metric}'] = np.sqrt(np.maximum(var, 0.0))
+    
+    # Missing timestamps are skipped and not counted, as by min/max/count.
+    # NaT is the smallest int64, so it never wins the maximum; for the
+    # minimum it is swapped for the largest int64 and mapped back after
+    timestamps = grouped('Timestamp')
+    valid = ~np.isnat(timestamps)
+    ticks = timestamps.view(np.int64)
+    never = np.iinfo(np.int64).max
+    first = np.minimum.reduceat(np.where(valid, ticks, never), starts)
+    first[first == never] = np.iinfo(np.int64).min
+    summary['Start Date'] = first.view(timestamps.dtype)
+    summary['End Date'] = np.maximum.reduceat(ticks, starts).view(timestamps.dtype)
+    summary['Records'] = np.add.reduceat(valid, starts, dtype=np.int64)
+    
+    summary = pd.DataFrame(summary, columns=columns).round(2)
+    
+    # Sort by average GHI (descending)
+    summary = summary.sort_values('Avg GHI (W/m²)', ascending=False, ignore_index=True)
     
-    return summary
\ No newline at end of file
+    return summary
@@ -11,13 +11,17 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.data_loader import SolarDataLoader, load_solar_data
-from src.data_cleaner import SolarDataCleaner, clean_solar_data
-from src.data_exporter import SolarDataExporter, export_cleaned_data
+# The src modules (and pandas/numpy behind them) are imported inside each
+# example so that running or importing this script without an example
+# stays fast.
 
 
 def example_using_classes():
     """Example using class-based approach"""
+    from src.data_loader import SolarDataLoader
+    from src.data_cleaner import SolarDataCleaner
+    from src.data_exporter import SolarDataExporter
+    
     print("=" * 80)
     print("Example 1: Using Classes")
     print("=" * 80)
@@ -65,6 +69,10 @@ def example_using_classes():
 
 def example_using_functions():
     """Example using convenience functions"""
+    from src.data_loader import load_solar_data
+    from src.data_cleaner import clean_solar_data
+    from src.data_exporter import export_cleaned_data
+    
     print("\n" + "=" * 80)
     print("Example 2: Using Convenience Functions")
     print("=" * 80)
@@ -97,6 +105,10 @@ def example_using_functions():
 
 def example_minimal_workflow():
     """Example of minimal workflow for quick processing"""
+    from src.data_loader import load_solar_data
+    from src.data_cleaner import clean_solar_data
+    from src.data_exporter import export_cleaned_data
+    
     print("\n" + "=" * 80)
     print("Example 3: Minimal Workflow")
     print("=" * 80)
@@ -7,11 +7,142 @@ This module provides reusable functions for cleaning solar data, including:
 - Data validation
 """
 
+import warnings
+
 import pandas as pd
 import numpy as np
-from scipy import stats
 from typing import List, Optional, Tuple
 
+# Column kernels used for outliers, set up on first use (see _outlier_kernels)
+_KERNELS = None
+
+
+def _mean_std_numpy(values: np.ndarray) -> Tuple[float, float]:
+    """
+    Mean and population standard deviation of a column, ignoring NaNs.
+    
+    Parameters:
+    -----------
+    values : np.ndarray
+        Float64 column values
+        
+    Returns:
+    --------
+    tuple
+        (mean, std), both NaN if every value is missing
+    """
+    # An all-missing column makes nanmean/nanstd warn through the warnings
+    # module (np.errstate doesn't cover it); its NaN result is expected
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        return float(np.nanmean(values)), float(np.nanstd(values))
+
+
+def _flag_and_cap_numpy(values: np.ndarray, lower_bound: float, upper_bound: float,
+                        out: np.ndarray, flag: np.ndarray) -> Tuple[int, int]:
+    """
+    Flag and cap the outliers of one column with NumPy.
+    
+    Parameters:
+    -----------
+    values : np.ndarray
+        Float64 column values (NaNs are passed through)
+    lower_bound, upper_bound : float
+        Values outside these bounds are outliers and get capped to them
+    out : np.ndarray
+        Float64 array receiving the capped values
+    flag : np.ndarray
+        Boolean row flags, set to True where this column has an outlier
+        
+    Returns:
+    --------
+    tuple
+        (outliers in the column, rows flagged for the first time)
+    """
+    outlier_mask = (values < lower_bound) | (values > upper_bound)
+    newly_flagged = np.count_nonzero(outlier_mask & ~flag)
+    flag |= outlier_mask
+    np.clip(values, lower_bound, upper_bound, out=out)
+    return int(outlier_mask.sum()), int(newly_flagged)
+
+
+def _build_numba_kernels(numba):
+    """
+    Compile the Numba versions of the outlier kernels.
+    
+    Parameters:
+    -----------
+    numba : module
+        The imported numba package
+        
+    Returns:
+    --------
+    tuple
+        (mean/std kernel, flag-and-cap kernel)
+    """
+    # No fastmath: it assumes there are no NaNs, and missing values must
+    # be skipped by the statistics and passed through by the capping
+    @numba.njit(cache=True)
+    def _mean_std_numba(values):
+        """Numba version of _mean_std_numpy (one Welford pass)."""
+        n = 0
+        mean = 0.0
+        m2 = 0.0
+        for i in range(values.shape[0]):
+            v = values[i]
+            if not np.isnan(v):
+                n += 1
+                delta = v - mean
+                mean += delta / n
+                m2 += delta * (v - mean)
+        
+        if n == 0:
+            return np.nan, np.nan
+        return mean, np.sqrt(m2 / n)
+    
+    @numba.njit(cache=True, parallel=True)
+    def _flag_and_cap_numba(values, lower_bound, upper_bound, out, flag):
+        """Numba version of _flag_and_cap_numpy (one parallel pass)."""
+        count = 0
+        newly_flagged = 0
+        for i in numba.prange(values.shape[0]):
+            v = values[i]
+            if v < lower_bound or v > upper_bound:
+                out[i] = lower_bound if v < lower_bound else upper_bound
+                count += 1
+                if not flag[i]:
+                    newly_flagged += 1
+                    flag[i] = True
+            else:
+                out[i] = v
+        return count, newly_flagged
+    
+    return _mean_std_numba, _flag_and_cap_numba
+
+
+def _outlier_kernels():
+    """
+    Get the column kernels used for outliers.
+    
+    numba is optional and slow to import, so it is only imported (and the
+    kernels compiled) the first time outliers are processed, keeping
+    `import src` fast. Without numba the NumPy kernels are used.
+    
+    Returns:
+    --------
+    tuple
+        (mean/std kernel, flag-and-cap kernel)
+    """
+    global _KERNELS
+    if _KERNELS is None:
+        try:
+            import numba
+        except ImportError:
+            _KERNELS = (_mean_std_numpy, _flag_and_cap_numpy)
+        else:
+            _KERNELS = _build_numba_kernels(numba)
+    return _KERNELS
+
 
 class SolarDataCleaner:
     """
@@ -24,7 +155,7 @@ class SolarDataCleaner:
     - Data quality reporting
     """
     
-    def __init__(self, df: pd.DataFrame):
+    def __init__(self, df: pd.DataFrame, copy: bool = True):
         """
         Initialize the data cleaner.
         
@@ -32,8 +163,20 @@ class SolarDataCleaner:
         -----------
         df : pd.DataFrame
             Input dataframe to clean
+        copy : bool, default True
+            Work on a private copy of df. If False, df itself is cleaned
+            (columns are replaced and 'Outlier_Flag' is added to it), which
+            saves a full copy of a large frame
         """
-        self.df = df.copy()
+        # At most one defensive copy; every later step mutates self.df in
+        # place instead of copying it again. Buffers of a frame we did not
+        # copy may be shared with other frames, so they are never written
+        # into directly (see impute_missing_values)
+        self.df = df.copy() if copy else df
+        self._owned = copy
+        # The cleaning steps never turn a numeric column into a non-numeric
+        # one, so the numeric columns are looked up once
+        self._numeric_cols = tuple(self.df.select_dtypes(include=[np.number]).columns)
         self.df_cleaned = None
         self.outlier_flags = {}
         self.cleaning_stats = {}
@@ -52,19 +195,7 @@ class SolarDataCleaner:
         dict
             Dictionary with missing value statistics
         """
-        missing = self.df.isna().sum()
-        missing_pct = (missing / len(self.df)) * 100
-        
-        high_missing = missing_pct[missing_pct > threshold * 100]
-        
-        stats = {
-            'total_missing': missing.sum(),
-            'missing_by_column': missing.to_dict(),
-            'missing_percentage': missing_pct.to_dict(),
-            'high_missing_columns': high_missing.to_dict() if len(high_missing) > 0 else {}
-        }
-        
-        return stats
+        return _missing_value_stats(self.df.isna().sum(), len(self.df), threshold)
     
     def impute_missing_values(self, columns: Optional[List[str]] = None, 
                              method: str = 'median') -> pd.DataFrame:
@@ -84,27 +215,49 @@ class SolarDataCleaner:
             Dataframe with imputed values
         """
         if columns is None:
-            numeric_cols = self.df.select_dtypes(include=[np.number]).columns
-            columns = list(numeric_cols)
+            columns = list(self._numeric_cols)
+        
+        if method not in ('median', 'mean', 'mode'):
+            raise ValueError(f"Unknown imputation method: {method}")
+        
+        df_imputed = self.df
+        columns = [col for col in columns if col in df_imputed.columns]
+        if not columns:
+            return df_imputed
         
-        df_imputed = self.df.copy()
+        # Compute the fill values of all columns in one call
+        subset = df_imputed[columns]
+        if method == 'median':
+            fill_values = subset.median(numeric_only=True)
+        elif method == 'mean':
+            fill_values = subset.mean(numeric_only=True)
+        else:
+            modes = subset.mode()
+            # Columns without a mode (all values missing) are filled with 0
+            fill_values = modes.iloc[0].fillna(0) if len(modes) > 0 else 0
         
+        if not isinstance(fill_values, pd.Series):
+            fill_values = pd.Series(fill_values, index=columns)
+        
+        # Float columns of a frame the cleaner owns are filled by writing
+        # straight into their NumPy buffers; anything else (other dtypes,
+        # read-only or shared data) goes through pandas' fillna
+        fallback_columns = []
         for col in columns:
-            if col not in df_imputed.columns:
-                continue
-                
-            if method == 'median':
-                fill_value = df_imputed[col].median()
-            elif method == 'mean':
-                fill_value = df_imputed[col].mean()
-            elif method == 'mode':
-                fill_value = df_imputed[col].mode()[0] if len(df_imputed[col].mode()) > 0 else 0
-            else:
-                raise ValueError(f"Unknown imputation method: {method}")
-            
-            df_imputed[col].fillna(fill_value, inplace=True)
+            dtype = df_imputed[col].dtype
+            fill_value = fill_values.get(col, np.nan)
+            # Only NumPy float dtypes hand out a view of the frame's own data
+            if (self._owned and isinstance(dtype, np.dtype) and dtype.kind == 'f'
+                    and not pd.isna(fill_value)):
+                values = df_imputed[col].to_numpy(copy=False)
+                if values.flags.writeable:
+                    np.copyto(values, fill_value, where=np.isnan(values))
+                    continue
+            fallback_columns.append(col)
+        
+        if fallback_columns:
+            df_imputed[fallback_columns] = df_imputed[fallback_columns].fillna(fill_values)
         
-        self.df = df_imputed
         return df_imputed
     
     def detect_outliers(self, columns: List[str], 
@@ -112,6 +265,9 @@ class SolarDataCleaner:
         """
         Detect outliers using Z-score method.
         
+        Only flags the outliers, leaving the values unchanged; use it when
+        capping is not wanted (cap_outliers() and clean() also set the flags).
+        
         Parameters:
         -----------
         columns : list of str
@@ -124,28 +280,30 @@ class SolarDataCleaner:
         pd.DataFrame
             Dataframe with outlier flags added
         """
-        # Create a copy to avoid modifying original dataframe
-        df_with_flags = self.df.copy()
-        # Initialize outlier flag column - all rows start as False (no outlier)
-        df_with_flags['Outlier_Flag'] = False
+        # Flags are added to the cleaner's own frame (copied once in __init__)
+        df_with_flags = self.df
+        # Row flags are OR-ed together in NumPy and written to the
+        # 'Outlier_Flag' column once; all rows start as False (no outlier)
+        outlier_any = np.zeros(len(df_with_flags), dtype=bool)
+        column_mean_std, _ = _outlier_kernels()
         
         for col in columns:
             # Skip if column doesn't exist in dataframe
             if col not in df_with_flags.columns:
                 continue
             
-            # Calculate Z-scores using scipy.stats (more robust than manual calculation)
             # Z-score = (value - mean) / std_deviation
-            # Values with |Z| > threshold are considered outliers
-            z_scores = np.abs(stats.zscore(df_with_flags[col].dropna()))
+            # Values with |Z| > threshold are considered outliers, i.e.
+            # |value - mean| > threshold * std (one pass, NaNs ignored)
+            values = df_with_flags[col].to_numpy(dtype=np.float64)
+            mean, std = column_mean_std(values)
             
             # Create boolean mask: True where |Z-score| > threshold
             # This identifies rows with outliers in the current column
-            outlier_mask = np.abs(stats.zscore(df_with_flags[col])) > z_threshold
+            outlier_mask = np.abs(values - mean) > z_threshold * std
             
-            # Update the Outlier_Flag column: set to True for detected outliers
-            # Using .loc ensures we're modifying the dataframe in-place safely
-            df_with_flags.loc[outlier_mask, 'Outlier_Flag'] = True
+            # Mark the rows with an outlier in the current column
+            outlier_any |= outlier_mask
             
             # Store statistics for reporting: count and percentage of outliers
             num_outliers = outlier_mask.sum()
@@ -154,8 +312,7 @@ class SolarDataCleaner:
                 'percentage': float((num_outliers / len(df_with_flags)) * 100)
             }
         
-        # Update instance dataframe and return
-        self.df = df_with_flags
+        df_with_flags['Outlier_Flag'] = outlier_any
         return df_with_flags
     
     def cap_outliers(self, columns: List[str], 
@@ -164,7 +321,9 @@ class SolarDataCleaner:
         Cap outliers to ±z_threshold standard deviations.
         
         This method uses Winsorization: values beyond ±z_threshold standard deviations
-        are capped to the boundary values rather than removed.
+        are capped to the boundary values rather than removed. Capped rows are
+        also marked in the 'Outlier_Flag' column, alongside any rows it
+        already flags.
         
         Parameters:
         -----------
@@ -178,33 +337,116 @@ class SolarDataCleaner:
         pd.DataFrame
             Dataframe with outliers capped
         """
-        # Create copy to avoid modifying original
-        df_capped = self.df.copy()
+        # Flags already set by detect_outliers are kept
+        self._flag_and_cap(columns, z_threshold, keep_flags=True)
+        
+        # Store cleaned dataframe and return
+        self.df_cleaned = self.df
+        return self.df_cleaned
+    
+    def _flag_and_cap(self, columns: List[str], z_threshold: float,
+                      keep_flags: bool = False) -> Tuple[np.ndarray, int]:
+        """
+        Flag and cap outliers in a single pass per column.
+        
+        Detection and capping share the same bounds (mean ± z_threshold * std),
+        so each column's mean/std, outlier mask and clipped values are
+        computed together, and the row flags are accumulated in one boolean
+        array that is written to 'Outlier_Flag' once at the end.
+        
+        Parameters:
+        -----------
+        columns : list of str
+            Columns to flag and cap
+        z_threshold : float
+            Z-score threshold for detection and capping
+        keep_flags : bool, default False
+            Start from an existing 'Outlier_Flag' column (e.g. set by
+            detect_outliers on other columns) instead of all False
+            
+        Returns:
+        --------
+        tuple
+            (boolean array, True for rows with an outlier in any column;
+            number of such rows)
+        """
+        df = self.df
+        if keep_flags and 'Outlier_Flag' in df.columns:
+            outlier_any = df['Outlier_Flag'].to_numpy(dtype=bool, na_value=False, copy=True)
+        else:
+            outlier_any = np.zeros(len(df), dtype=bool)
+        # Counted by the kernels as rows get flagged, so no final sum
+        total_outliers = int(np.count_nonzero(outlier_any))
+        # Capped columns that can't be written in place, assigned together
+        capped_columns = {}
+        # Numba kernels when available, NumPy otherwise
+        column_mean_std, flag_and_cap_column = _outlier_kernels()
         
         for col in columns:
             # Skip if column doesn't exist
-            if col not in df_capped.columns:
+            if col not in df.columns:
                 continue
             
-            # Calculate mean and standard deviation for the column
-            # These are used to determine the capping boundaries
-            mean = df_capped[col].mean()
-            std = df_capped[col].std()
+            values = df[col].to_numpy(dtype=np.float64, na_value=np.nan)
+            mean, std = column_mean_std(values)
             
-            # Calculate boundaries: values beyond these will be capped
-            # Lower bound: mean - (z_threshold * std)
-            # Upper bound: mean + (z_threshold * std)
-            lower_bound = mean - (z_threshold * std)
-            upper_bound = mean + (z_threshold * std)
+            num_outliers = 0
+            # Constant and all-missing columns have no outliers: nothing to
+            # flag or cap, and the column is left as it is
+            if std > 0 and np.isfinite(std):
+                # Values beyond these boundaries are outliers and get capped
+                lower_bound = mean - (z_threshold * std)
+                upper_bound = mean + (z_threshold * std)
+                
+                # Float columns of a frame the cleaner owns are capped in
+                # their own buffers; other columns are collected and
+                # assigned in one call after the loop
+                dtype = df[col].dtype
+                buffer = None
+                if self._owned and isinstance(dtype, np.dtype) and dtype.kind == 'f':
+                    buffer = df[col].to_numpy(copy=False)
+                    if not buffer.flags.writeable:
+                        buffer = None
+                
+                # float64 buffers are written directly by the kernel
+                if buffer is not None and buffer.dtype == np.float64:
+                    capped = buffer
+                else:
+                    capped = np.empty_like(values)
+                num_outliers, newly_flagged = flag_and_cap_column(
+                    values, lower_bound, upper_bound, capped, outlier_any
+                )
+                total_outliers += newly_flagged
+                
+                # Columns without outliers keep their values and dtype
+                if num_outliers == 0:
+                    pass
+                elif buffer is not None:
+                    if capped is not buffer:
+                        np.copyto(buffer, capped, casting='same_kind')
+                elif pd.api.types.is_extension_array_dtype(dtype):
+                    # Nullable dtypes are clipped by pandas so missing values
+                    # stay NA; like NumPy integers, nullable integers become
+                    # floats once capped
+                    series = df[col]
+                    if not pd.api.types.is_float_dtype(dtype):
+                        series = series.astype('Float64')
+                    capped_columns[col] = series.clip(lower=lower_bound, upper=upper_bound)
+                elif pd.api.types.is_float_dtype(dtype):
+                    capped_columns[col] = capped.astype(dtype, copy=False)
+                else:
+                    capped_columns[col] = capped
             
-            # Clip values: anything below lower_bound becomes lower_bound,
-            # anything above upper_bound becomes upper_bound
-            # This preserves the data structure while removing extreme values
-            df_capped[col] = df_capped[col].clip(lower=lower_bound, upper=upper_bound)
+            # Store statistics for reporting: count and percentage of outliers
+            self.outlier_flags[col] = {
+                'count': num_outliers,
+                'percentage': float((num_outliers / len(df)) * 100)
+            }
         
-        # Store cleaned dataframe and return
-        self.df_cleaned = df_capped
-        return df_capped
+        if capped_columns:
+            df[list(capped_columns)] = pd.DataFrame(capped_columns, index=df.index)
+        df['Outlier_Flag'] = outlier_any
+        return outlier_any, total_outliers
     
     def clean(self, numeric_columns: Optional[List[str]] = None,
              outlier_columns: Optional[List[str]] = None,
@@ -235,7 +477,7 @@ class SolarDataCleaner:
         
         # Impute missing values
         if numeric_columns is None:
-            numeric_columns = list(self.df.select_dtypes(include=[np.number]).columns)
+            numeric_columns = list(self._numeric_cols)
         
         self.impute_missing_values(columns=numeric_columns, method=imputation_method)
         
@@ -243,12 +485,14 @@ class SolarDataCleaner:
         if outlier_columns is None:
             outlier_columns = numeric_columns
         
-        self.detect_outliers(columns=outlier_columns, z_threshold=z_threshold)
-        self.cap_outliers(columns=outlier_columns, z_threshold=z_threshold)
+        # Capping sets 'Outlier_Flag' from the same bounds, so a separate
+        # detect_outliers() sweep is not needed (same steps as cap_outliers)
+        _, total_outliers = self._flag_and_cap(outlier_columns, z_threshold)
+        self.df_cleaned = self.df
         
         # Store cleaning statistics
         self.cleaning_stats['outliers'] = self.outlier_flags
-        self.cleaning_stats['total_outliers'] = int(self.df['Outlier_Flag'].sum()) if 'Outlier_Flag' in self.df.columns else 0
+        self.cleaning_stats['total_outliers'] = total_outliers
         
         return self.df_cleaned if self.df_cleaned is not None else self.df
     
@@ -264,11 +508,165 @@ class SolarDataCleaner:
         return self.cleaning_stats
 
 
+def _missing_value_stats(missing: pd.Series, n_rows: int,
+                         threshold: float = 0.05) -> dict:
+    """
+    Build the missing value statistics from per-column missing counts.
+    
+    Parameters:
+    -----------
+    missing : pd.Series
+        Number of missing values per column
+    n_rows : int
+        Number of rows in the dataframe
+    threshold : float, default 0.05
+        Threshold for missing value percentage (5%)
+        
+    Returns:
+    --------
+    dict
+        Dictionary with missing value statistics
+    """
+    missing_pct = (missing / n_rows) * 100
+    
+    high_missing = missing_pct[missing_pct > threshold * 100]
+    
+    result = {
+        'total_missing': missing.sum(),
+        'missing_by_column': missing.to_dict(),
+        'missing_percentage': missing_pct.to_dict(),
+        'high_missing_columns': high_missing.to_dict() if len(high_missing) > 0 else {}
+    }
+    
+    return result
+
+
+def _clean_with_polars(df: pd.DataFrame,
+                       numeric_columns: Optional[List[str]] = None,
+                       outlier_columns: Optional[List[str]] = None,
+                       imputation_method: str = 'median',
+                       z_threshold: float = 3.0) -> Tuple[pd.DataFrame, dict]:
+    """
+    Run the cleaning pipeline as Polars expressions.
+    
+    Mirrors SolarDataCleaner.clean(): the frame is converted once, imputation
+    and the outlier statistics run as multithreaded column expressions, and
+    the result is converted back to pandas with the original index.
+    
+    Parameters:
+    -----------
+    df : pd.DataFrame
+        Input dataframe
+    numeric_columns : list of str, optional
+        Columns to impute missing values for
+    outlier_columns : list of str, optional
+        Columns to check for outliers
+    imputation_method : str, default 'median'
+        Method for imputation
+    z_threshold : float, default 3.0
+        Z-score threshold for outlier detection/capping
+        
+    Returns:
+    --------
+    tuple
+        (cleaned_dataframe, cleaning_report)
+    """
+    try:
+        import polars as pl
+    except ImportError as e:
+        raise ImportError("engine='polars' requires the polars package") from e
+    
+    if imputation_method not in ['median', 'mean', 'mode']:
+        raise ValueError(f"Unknown imputation method: {imputation_method}")
+    
+    missing = df.isna().sum()
+    report = {'missing_values': _missing_value_stats(missing, len(df))}
+    
+    if numeric_columns is None:
+        numeric_columns = list(df.select_dtypes(include=[np.number]).columns)
+    if outlier_columns is None:
+        outlier_columns = numeric_columns
+    
+    # NaNs become nulls, so fill_null/mean/std skip them like pandas does
+    lf = pl.from_pandas(df).lazy()
+    
+    # Only columns that actually have gaps are filled, so integer columns
+    # keep their dtype
+    fill_exprs = []
+    for col in numeric_columns:
+        if col not in df.columns or missing[col] == 0:
+            continue
+        if imputation_method == 'median':
+            fill_value = pl.col(col).median()
+        elif imputation_method == 'mean':
+            fill_value = pl.col(col).mean()
+        else:
+            # Smallest mode, as pandas' mode().iloc[0]; 0 for all-null columns
+            fill_value = pl.col(col).drop_nulls().mode().min().fill_null(0)
+        fill_exprs.append(pl.col(col).fill_null(fill_value))
+    if fill_exprs:
+        lf = lf.with_columns(fill_exprs)
+    
+    # Bounds for every outlier column in one parallel aggregation
+    outlier_columns = [col for col in outlier_columns if col in df.columns]
+    bound_exprs = []
+    for col in outlier_columns:
+        mean = pl.col(col).cast(pl.Float64).mean()
+        std = pl.col(col).cast(pl.Float64).std(ddof=0)
+        bound_exprs += [(mean - z_threshold * std).alias(f'{col}_lo'),
+                        (mean + z_threshold * std).alias(f'{col}_hi')]
+    bounds = lf.select(bound_exprs).collect().row(0, named=True) if bound_exprs else {}
+    
+    mask_exprs = []
+    cap_exprs = {}
+    for col in outlier_columns:
+        lower_bound, upper_bound = bounds[f'{col}_lo'], bounds[f'{col}_hi']
+        # Constant or all-missing column: nothing to flag or cap
+        if lower_bound is None or upper_bound is None or lower_bound == upper_bound:
+            mask_exprs.append(pl.lit(False).alias(f'__outlier_{col}'))
+            continue
+        values = pl.col(col)
+        if not df[col].dtype.kind == 'f':
+            values = values.cast(pl.Float64)
+        mask_exprs.append(
+            ((values < lower_bound) | (values > upper_bound))
+            .fill_null(False).alias(f'__outlier_{col}')
+        )
+        cap_exprs[col] = values.clip(lower_bound=lower_bound, upper_bound=upper_bound).alias(col)
+    
+    mask_names = [f'__outlier_{col}' for col in outlier_columns]
+    lf = lf.with_columns(mask_exprs).with_columns(
+        pl.any_horizontal(mask_names).alias('Outlier_Flag') if mask_names
+        else pl.lit(False).alias('Outlier_Flag')
+    )
+    result = lf.collect()
+    
+    counts = result.select([pl.col(name).sum() for name in mask_names]).row(0) if mask_names else ()
+    # As in the pandas engine, columns without outliers keep their dtype
+    capped = [cap_exprs[col] for col, count in zip(outlier_columns, counts) if count > 0]
+    if capped:
+        result = result.with_columns(capped)
+    report['outliers'] = {
+        col: {
+            'count': int(count),
+            'percentage': float((count / len(df)) * 100)
+        }
+        for col, count in zip(outlier_columns, counts)
+    }
+    report['total_outliers'] = int(result['Outlier_Flag'].sum())
+    
+    df_cleaned = result.drop(mask_names).to_pandas()
+    df_cleaned.index = df.index
+    return df_cleaned, report
+
+
 def clean_solar_data(df: pd.DataFrame,
                     numeric_columns: Optional[List[str]] = None,
                     outlier_columns: Optional[List[str]] = None,
                     imputation_method: str = 'median',
-                    z_threshold: float = 3.0) -> Tuple[pd.DataFrame, dict]:
+                    z_threshold: float = 3.0,
+                    engine: str = 'pandas',
+                    copy: bool = True) -> Tuple[pd.DataFrame, dict]:
     """
     Convenience function to clean solar data.
     
@@ -284,6 +682,12 @@ def clean_solar_data(df: pd.DataFrame,
         Method for imputation
     z_threshold : float, default 3.0
         Z-score threshold for outlier detection/capping
+    engine : str, default 'pandas'
+        'pandas', or 'polars' to run the pipeline as parallel Polars
+        expressions (requires the optional polars package)
+    copy : bool, default True
+        Clean a copy of df. If False, the pandas engine cleans df itself;
+        the polars engine never modifies df
         
     Returns:
     --------
@@ -296,7 +700,18 @@ def clean_solar_data(df: pd.DataFrame,
     ...                                     outlier_columns=['GHI', 'DNI', 'DHI'])
     >>> print(f"Outliers detected: {report['total_outliers']}")
     """
-    cleaner = SolarDataCleaner(df)
+    if engine == 'polars':
+        return _clean_with_polars(
+            df,
+            numeric_columns=numeric_columns,
+            outlier_columns=outlier_columns,
+            imputation_method=imputation_method,
+            z_threshold=z_threshold
+        )
+    if engine != 'pandas':
+        raise ValueError(f"Unknown engine: {engine}")
+    
+    cleaner = SolarDataCleaner(df, copy=copy)
     df_cleaned = cleaner.clean(
         numeric_columns=numeric_columns,
         outlier_columns=outlier_columns,
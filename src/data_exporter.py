@@ -9,12 +9,16 @@ from pathlib import Path
 from typing import List, Optional, Union
 
 
+# Columns added during analysis that are not part of the cleaned dataset
+DEFAULT_TEMP_COLUMNS = ['Hour', 'Month', 'Day', 'WD_bin', 'Outlier_Flag']
+
+
 class SolarDataExporter:
     """
     A class for exporting cleaned solar data.
     
     This class handles:
-    - Exporting to CSV
+    - Exporting to CSV or Parquet
     - Removing temporary columns
     - Data validation before export
     """
@@ -46,30 +50,58 @@ class SolarDataExporter:
             Dataframe with temporary columns removed
         """
         if temp_columns is None:
-            temp_columns = ['Hour', 'Month', 'Day', 'WD_bin', 'Outlier_Flag']
+            temp_columns = DEFAULT_TEMP_COLUMNS
         
         columns_to_remove = [col for col in temp_columns if col in self.df.columns]
         self.df = self.df.drop(columns=columns_to_remove)
         
         return self.df
     
+    def _export_columns(self, remove_temp: bool = True,
+                        temp_columns: Optional[List[str]] = None) -> List[str]:
+        """
+        Get the columns to write, without dropping anything from the dataframe.
+        
+        Parameters:
+        -----------
+        remove_temp : bool, default True
+            Whether to leave out temporary columns
+        temp_columns : list of str, optional
+            Temporary columns to leave out (if remove_temp=True)
+            
+        Returns:
+        --------
+        list of str
+            Columns to export, in dataframe order
+        """
+        if not remove_temp:
+            return list(self.df.columns)
+        
+        if temp_columns is None:
+            temp_columns = DEFAULT_TEMP_COLUMNS
+        temp_columns = set(temp_columns)
+        return [col for col in self.df.columns if col not in temp_columns]
+    
     def export(self, output_path: Union[str, Path],
               remove_temp: bool = True,
               temp_columns: Optional[List[str]] = None,
-              index: bool = False) -> Path:
+              index: bool = False,
+              format: str = 'csv') -> Path:
         """
-        Export cleaned dataframe to CSV.
+        Export cleaned dataframe to CSV or Parquet.
         
         Parameters:
         -----------
         output_path : str or Path
-            Path where to save the cleaned CSV file
+            Path where to save the cleaned file
         remove_temp : bool, default True
             Whether to remove temporary columns before export
         temp_columns : list of str, optional
             Temporary columns to remove (if remove_temp=True)
         index : bool, default False
             Whether to include index in export
+        format : str, default 'csv'
+            Output format: 'csv' or 'parquet'
             
         Returns:
         --------
@@ -82,17 +114,30 @@ class SolarDataExporter:
         >>> output_file = exporter.export('data/benin_clean.csv')
         >>> print(f"Exported to: {output_file}")
         """
+        if format not in ['csv', 'parquet']:
+            raise ValueError(f"Unknown export format: {format}")
+        
         output_path = Path(output_path)
         
         # Create output directory if it doesn't exist
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Remove temporary columns if requested
-        if remove_temp:
-            self.remove_temp_columns(temp_columns)
+        # Temporary columns are left out at write time instead of being
+        # dropped from the dataframe first
+        columns = self._export_columns(remove_temp, temp_columns)
+        
+        if format == 'parquet':
+            # pyarrow is only needed for Parquet, so importing src stays fast
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            table = pa.Table.from_pandas(self.df, columns=columns, preserve_index=index)
+            pq.write_table(table, output_path)
+            return output_path
         
-        # Export to CSV
-        self.df.to_csv(output_path, index=index)
+        # CSV stays on pandas: the pyarrow CSV writer quotes headers, writes
+        # whole floats without '.0' and rejects mixed-type object columns,
+        # so its files would not read back the same
+        self.df.to_csv(output_path, columns=columns, index=index)
         
         return output_path
 
@@ -101,7 +146,8 @@ def export_cleaned_data(df: pd.DataFrame,
                         output_path: Union[str, Path],
                         remove_temp: bool = True,
                         temp_columns: Optional[List[str]] = None,
-                        index: bool = False) -> Path:
+                        index: bool = False,
+                        format: str = 'csv') -> Path:
     """
     Convenience function to export cleaned data.
     
@@ -110,13 +156,15 @@ def export_cleaned_data(df: pd.DataFrame,
     df : pd.DataFrame
         Cleaned dataframe to export
     output_path : str or Path
-        Path where to save the cleaned CSV file
+        Path where to save the cleaned file
     remove_temp : bool, default True
         Whether to remove temporary columns before export
     temp_columns : list of str, optional
         Temporary columns to remove (if remove_temp=True)
     index : bool, default False
         Whether to include index in export
+    format : str, default 'csv'
+        Output format: 'csv' or 'parquet'
         
     Returns:
     --------
@@ -133,6 +181,7 @@ def export_cleaned_data(df: pd.DataFrame,
         output_path=output_path,
         remove_temp=remove_temp,
         temp_columns=temp_columns,
-        index=index
+        index=index,
+        format=format
     )
 
@@ -7,7 +7,41 @@ This module provides reusable functions for loading and preprocessing solar data
 import pandas as pd
 import numpy as np
 from pathlib import Path
-from typing import Optional, Union
+from typing import List, Optional, Union
+
+
+# Standard sensor columns of the station files, e.g. for
+# load(columns=['Timestamp'] + DEFAULT_NUMERIC_COLS)
+DEFAULT_NUMERIC_COLS = ['GHI', 'DNI', 'DHI', 'ModA', 'ModB', 'Tamb', 'RH', 'WS', 'WSgust']
+
+
+def _parse_timestamps(timestamps: pd.Series,
+                      timestamp_format: Optional[str] = None) -> pd.Series:
+    """
+    Parse text timestamps with an explicit format where possible.
+    
+    Parameters:
+    -----------
+    timestamps : pd.Series
+        Timestamp strings
+    timestamp_format : str, optional
+        strftime format of the timestamps. If None, ISO 8601 is tried
+        before falling back to format inference
+        
+    Returns:
+    --------
+    pd.Series
+        Parsed timestamps
+    """
+    # cache=True parses each distinct string once
+    if timestamp_format is not None:
+        return pd.to_datetime(timestamps, format=timestamp_format, cache=True)
+    
+    try:
+        return pd.to_datetime(timestamps, format='ISO8601', cache=True)
+    except ValueError:
+        # Not ISO 8601: let pandas infer the format
+        return pd.to_datetime(timestamps, cache=True)
 
 
 class SolarDataLoader:
@@ -33,8 +67,12 @@ class SolarDataLoader:
         self.data_path = Path(data_path)
         self.df = None
         self.df_indexed = None
+        self._numeric_cols = None
         
-    def load(self, timestamp_col: str = 'Timestamp') -> pd.DataFrame:
+    def load(self, timestamp_col: str = 'Timestamp',
+             dtype: str = 'float64',
+             timestamp_format: Optional[str] = None,
+             columns: Optional[List[str]] = None) -> pd.DataFrame:
         """
         Load the dataset from CSV file.
         
@@ -42,23 +80,52 @@ class SolarDataLoader:
         -----------
         timestamp_col : str, default 'Timestamp'
             Name of the timestamp column
+        dtype : str, default 'float64'
+            Dtype of the float columns: 'float64', or 'float32' to halve
+            their memory (sensor readings fit float32 precision)
+        timestamp_format : str, optional
+            strftime format of timestamps the CSV reader leaves as text,
+            e.g. '%m/%d/%Y %H:%M'. If None, ISO 8601 is tried before
+            falling back to format inference
+        columns : list of str, optional
+            Columns to read (the timestamp column is always included).
+            If None, reads all columns
             
         Returns:
         --------
         pd.DataFrame
             Loaded dataframe with timestamp converted to datetime
         """
+        if dtype not in ['float32', 'float64']:
+            raise ValueError(f"Unknown float dtype: {dtype}")
+        
         if not self.data_path.exists():
             raise FileNotFoundError(f"Data file not found: {self.data_path}")
         
-        self.df = pd.read_csv(self.data_path)
+        # The multithreaded pyarrow parser already types ISO timestamps while
+        # reading, so the column is only re-parsed for other formats
+        if columns is not None and timestamp_col not in columns:
+            columns = [timestamp_col] + list(columns)
+        # Unused columns are skipped by the reader instead of being parsed
+        self.df = pd.read_csv(self.data_path, engine='pyarrow', usecols=columns)
         
         # Convert timestamp to datetime
         if timestamp_col in self.df.columns:
-            self.df[timestamp_col] = pd.to_datetime(self.df[timestamp_col])
+            timestamps = self.df[timestamp_col]
+            if pd.api.types.is_datetime64_any_dtype(timestamps):
+                # Same unit as pd.to_datetime; keeps a UTC offset if present
+                self.df[timestamp_col] = timestamps.dt.as_unit('ns')
+            else:
+                self.df[timestamp_col] = _parse_timestamps(timestamps, timestamp_format)
         else:
             raise ValueError(f"Timestamp column '{timestamp_col}' not found in data")
         
+        if dtype == 'float32':
+            float_cols = self.df.select_dtypes(include=['float64']).columns
+            self.df[float_cols] = self.df[float_cols].astype(np.float32)
+        
+        self._numeric_cols = tuple(self.df.select_dtypes(include=[np.number]).columns)
+        
         return self.df
     
     def set_time_index(self, timestamp_col: str = 'Timestamp') -> pd.DataFrame:
@@ -96,7 +163,7 @@ class SolarDataLoader:
         info = {
             'shape': self.df.shape,
             'columns': list(self.df.columns),
-            'numeric_columns': list(self.df.select_dtypes(include=[np.number]).columns),
+            'numeric_columns': list(self._numeric_cols),
             'date_range': (
                 self.df['Timestamp'].min(),
                 self.df['Timestamp'].max()
@@ -108,7 +175,10 @@ class SolarDataLoader:
 
 
 def load_solar_data(file_path: Union[str, Path], 
-                   timestamp_col: str = 'Timestamp') -> pd.DataFrame:
+                   timestamp_col: str = 'Timestamp',
+                   dtype: str = 'float64',
+                   timestamp_format: Optional[str] = None,
+                   columns: Optional[List[str]] = None) -> pd.DataFrame:
     """
     Convenience function to load solar data.
     
@@ -118,6 +188,13 @@ def load_solar_data(file_path: Union[str, Path],
         Path to the CSV data file
     timestamp_col : str, default 'Timestamp'
         Name of the timestamp column
+    dtype : str, default 'float64'
+        Dtype of the float columns: 'float64' or 'float32'
+    timestamp_format : str, optional
+        strftime format of non-ISO timestamps, e.g. '%m/%d/%Y %H:%M'
+    columns : list of str, optional
+        Columns to read, e.g. DEFAULT_NUMERIC_COLS (the timestamp column is
+        always included). If None, reads all columns
         
     Returns:
     --------
@@ -131,6 +208,11 @@ def load_solar_data(file_path: Union[str, Path],
     (525600, 19)
     """
     loader = SolarDataLoader(file_path)
-    df = loader.load(timestamp_col)
+    df = loader.load(
+        timestamp_col,
+        dtype=dtype,
+        timestamp_format=timestamp_format,
+        columns=columns
+    )
     return df
 
@@ -0,0 +1,415 @@
+"""
+Unit tests for app.utils module
+"""
+
+import io
+import os
+
+import pytest
+import pandas as pd
+import numpy as np
+from app import utils
+from app.utils import (
+    COUNTRY_DTYPE,
+    COUNTRY_FILES,
+    PARQUET_CACHE_FILE,
+    BOX_STAT_COLUMNS,
+    compute_box_stats,
+    compute_daily_ghi,
+    create_summary_table,
+    filter_data_by_countries,
+    filter_data_by_date_range,
+    load_all_countries_data,
+    load_data_from_uploaded_files,
+    lttb_indices
+)
+
+
+@pytest.fixture
+def sample_df():
+    """Create a small multi-country dataframe for testing"""
+    np.random.seed(42)
+    frames = []
+    for country, start in [('Benin', '2021-08-09'), ('Sierra Leone', '2021-10-30'),
+                           ('Togo', '2021-10-25')]:
+        frames.append(pd.DataFrame({
+            'Timestamp': pd.date_range(start, periods=200, freq='h'),
+            'Country': country,
+            'GHI': np.random.normal(240, 50, 200),
+            'DNI': np.random.normal(167, 40, 200),
+            'DHI': np.random.normal(115, 30, 200)
+        }))
+    df = pd.concat(frames, ignore_index=True)
+    df['Country'] = df['Country'].astype(COUNTRY_DTYPE)
+    return df
+
+
+@pytest.fixture
+def indexed_df(sample_df):
+    """Sample data sorted and indexed by country, as the loaders return it"""
+    return utils._index_by_country(sample_df)
+
+
+@pytest.fixture
+def gappy_df(sample_df):
+    """Indexed sample data with missing readings and a day without rows"""
+    df = sample_df.copy()
+    df.loc[20:50, 'GHI'] = np.nan       # Benin, including all of 2021-08-10
+    df.loc[250:260, 'DNI'] = np.nan     # Sierra Leone
+    # Togo has no rows on 2021-10-27
+    day = df['Timestamp'].dt.normalize() == pd.Timestamp('2021-10-27')
+    df = df[~((df['Country'] == 'Togo') & day)]
+    # Togo has a row without a timestamp
+    df.loc[500, 'Timestamp'] = pd.NaT
+    return utils._index_by_country(df)
+
+
+def _pandas_summary(df):
+    """Summary table as computed with groupby().agg before the reduceat rewrite"""
+    summary = df.groupby('Country', observed=True).agg({
+        'GHI': ['mean', 'median', 'std'],
+        'DNI': ['mean', 'median', 'std'],
+        'DHI': ['mean', 'median', 'std'],
+        'Timestamp': ['min', 'max', 'count']
+    }).round(2)
+    summary = summary.sort_values(('GHI', 'mean'), ascending=False).reset_index()
+    summary.columns = create_summary_table(df).columns
+    summary['Country'] = summary['Country'].astype(str)
+    return summary
+
+
+def _reference_lttb(x, y, n_out):
+    """Plain-Python Largest-Triangle-Three-Buckets, one bucket at a time"""
+    n = len(x)
+    every = (n - 2) / (n_out - 2)
+    selected = [0]
+    a = 0
+    for i in range(n_out - 2):
+        avg_start = int((i + 1) * every) + 1
+        avg_end = min(int((i + 2) * every) + 1, n)
+        avg_x = sum(x[avg_start:avg_end]) / (avg_end - avg_start)
+        avg_y = sum(y[avg_start:avg_end]) / (avg_end - avg_start)
+        
+        best_area, best = -1.0, None
+        for j in range(int(i * every) + 1, int((i + 1) * every) + 1):
+            area = abs((x[a] - avg_x) * (y[j] - y[a]) - (x[a] - x[j]) * (avg_y - y[a]))
+            if area > best_area:
+                best_area, best = area, j
+        selected.append(best)
+        a = best
+    selected.append(n - 1)
+    return np.array(selected)
+
+
+@pytest.fixture
+def data_dir(sample_df, tmp_path):
+    """Write the sample data as cleaned CSV files, one per country"""
+    for country, file in COUNTRY_FILES.items():
+        country_df = sample_df[sample_df['Country'] == country]
+        country_df.drop(columns='Country').to_csv(tmp_path / file, index=False)
+    return tmp_path
+
+
+class TestLoadAllCountriesData:
+    """Test cases for load_all_countries_data and its Parquet cache"""
+    
+    def test_builds_cache(self, data_dir):
+        """Test that the first load writes the cache and nothing else"""
+        df = load_all_countries_data(data_dir)
+        
+        assert (data_dir / PARQUET_CACHE_FILE).exists()
+        assert len(os.listdir(data_dir)) == len(COUNTRY_FILES) + 1
+        assert len(df) == 600
+        assert df.attrs['country_offsets']['Togo'] == (400, 600)
+    
+    def test_rebuilds_corrupt_cache(self, data_dir):
+        """Test that an unreadable cache newer than the CSVs is rebuilt"""
+        (data_dir / PARQUET_CACHE_FILE).write_bytes(b'not parquet')
+        
+        df = load_all_countries_data(data_dir)
+        
+        assert len(df) == 600
+        pd.testing.assert_frame_equal(load_all_countries_data(data_dir), df)
+    
+    def test_unwritable_cache(self, data_dir, monkeypatch):
+        """Test that the CSVs are served directly when the cache can't be written"""
+        def read_only(*args, **kwargs):
+            raise PermissionError('read-only directory')
+        monkeypatch.setattr(utils.tempfile, 'mkstemp', read_only)
+        
+        df = load_all_countries_data(
+            data_dir,
+            start_datetime='2021-10-25',
+            end_datetime='2021-10-25 10:00'
+        )
+        
+        assert not (data_dir / PARQUET_CACHE_FILE).exists()
+        assert df['Country'].tolist() == ['Togo'] * 10
+        assert list(df.columns) == ['Timestamp', 'Country', 'GHI', 'DNI', 'DHI']
+
+
+class TestDerivedFrames:
+    """Test cases for frames derived from the loaded dataframe"""
+    
+    def test_filters_clear_offsets(self, indexed_df):
+        """Test that filtered frames don't carry the full frame's offsets"""
+        by_country = filter_data_by_countries(indexed_df, ['Togo'])
+        by_date = filter_data_by_date_range(
+            indexed_df, ['Togo'], pd.Timestamp('2021-10-25'), pd.Timestamp('2021-10-26')
+        )
+        
+        assert by_country.attrs == {}
+        assert by_date.attrs == {}
+        assert indexed_df.attrs['country_offsets']['Togo'] == (400, 600)
+    
+    @pytest.mark.parametrize('reorder', [
+        lambda df: df.sort_values('Timestamp'),
+        lambda df: df.sample(frac=1, random_state=0)
+    ])
+    def test_reordered_frame(self, gappy_df, reorder):
+        """Test frames reordered after loading, which still carry its attrs"""
+        df = reorder(gappy_df)
+        assert df.attrs['country_offsets'] == gappy_df.attrs['country_offsets']
+        start, end = pd.Timestamp('2021-10-25 12:00'), pd.Timestamp('2021-10-26 12:00')
+        
+        filtered = filter_data_by_date_range(df, ['Togo'], start, end)
+        
+        mask = (df['Country'] == 'Togo') & (df['Timestamp'] >= start) & (df['Timestamp'] < end)
+        assert len(filtered) == 24
+        pd.testing.assert_frame_equal(filtered.sort_index(), df[mask].sort_index())
+        pd.testing.assert_frame_equal(compute_daily_ghi(df), compute_daily_ghi(gappy_df))
+    
+    def test_filter_filtered_frame(self, indexed_df):
+        """Test date filtering and daily means of an already filtered frame"""
+        togo = filter_data_by_countries(indexed_df, ['Togo'])
+        start, end = pd.Timestamp('2021-10-25 12:00'), pd.Timestamp('2021-10-27')
+        
+        filtered = filter_data_by_date_range(togo, ['Togo', 'Benin'], start, end)
+        expected = togo[(togo['Timestamp'] >= start) & (togo['Timestamp'] < end)]
+        pd.testing.assert_frame_equal(filtered, expected)
+        
+        daily = compute_daily_ghi(togo)
+        assert daily['Country'].unique().tolist() == ['Togo']
+        assert daily['GHI'].iloc[0] == pytest.approx(togo['GHI'].iloc[:24].mean())
+
+
+class TestComputeBoxStats:
+    """Test cases for compute_box_stats"""
+    
+    def test_compute_box_stats(self, sample_df):
+        """Test quartiles and fences against a pandas describe"""
+        box_stats = compute_box_stats(sample_df)
+        
+        for metric in ('GHI', 'DNI', 'DHI'):
+            expected = sample_df.groupby('Country', observed=True)[metric].describe()
+            stats = box_stats[metric]
+            assert list(stats.columns) == BOX_STAT_COLUMNS
+            np.testing.assert_allclose(stats['q1'], expected['25%'])
+            np.testing.assert_allclose(stats['median'], expected['50%'])
+            np.testing.assert_allclose(stats['q3'], expected['75%'])
+            np.testing.assert_allclose(stats['lowerfence'], expected['min'])
+            np.testing.assert_allclose(stats['upperfence'], expected['max'])
+    
+    def test_compute_box_stats_empty_selection(self, sample_df):
+        """Test that an empty selection gives empty per-metric frames"""
+        box_stats = compute_box_stats(sample_df.iloc[:0])
+        
+        assert set(box_stats) == {'GHI', 'DNI', 'DHI'}
+        for stats in box_stats.values():
+            assert len(stats) == 0
+            assert list(stats.columns) == BOX_STAT_COLUMNS
+
+
+class TestLoadDataFromUploadedFiles:
+    """Test cases for load_data_from_uploaded_files"""
+    
+    def test_mixed_column_types(self):
+        """Test that int and float columns of different files are combined"""
+        benin = io.BytesIO(
+            b"Timestamp,GHI,DNI,DHI,Tamb\n"
+            b"2021-08-09 00:01,1,2,3,25\n"
+        )
+        togo = io.BytesIO(
+            b"Timestamp,GHI,DNI,DHI,Tamb\n"
+            b"2021-10-25 00:01,1.5,2,3,25.5\n"
+        )
+        
+        df = load_data_from_uploaded_files({'benin': benin, 'togo': togo})
+        
+        assert df['Tamb'].tolist() == [25.0, 25.5]
+        assert df['Country'].tolist() == ['Benin', 'Togo']
+    
+    def test_missing_timestamp(self):
+        """Test that a blank timestamp doesn't become the data's time span"""
+        togo = io.BytesIO(
+            b"Timestamp,GHI,DNI,DHI\n"
+            b"2021-10-25 00:01,1.5,2,3\n"
+            b",2.0,2,3\n"
+            b"2021-10-25 00:03,2.5,2,3\n"
+        )
+        
+        df = load_data_from_uploaded_files({'togo': togo})
+        
+        assert df.attrs['tmin'] == pd.Timestamp('2021-10-25 00:01')
+        assert df.attrs['tmax'] == pd.Timestamp('2021-10-25 00:03')
+    
+    def test_non_iso_timestamps(self):
+        """Test that timestamps the Arrow reader rejects are parsed by pandas"""
+        togo = io.BytesIO(
+            b"Timestamp,GHI,DNI,DHI\n"
+            b"08/09/2021 00:01,1.5,2,3\n"
+            b"08/10/2021 00:01,2.5,2,3\n"
+        )
+        
+        df = load_data_from_uploaded_files({'togo': togo})
+        
+        assert df['Timestamp'].dtype == 'datetime64[ns]'
+        assert df['Timestamp'].iloc[1] == pd.Timestamp('2021-08-10 00:01')
+        assert df.attrs['tmax'] == pd.Timestamp('2021-08-10 00:01')
+
+
+class TestFilters:
+    """Test cases for the country and date filters against pandas masks"""
+    
+    @pytest.mark.parametrize('countries', [
+        ['Togo'],
+        ['Togo', 'Benin'],
+        ['Togo', 'Atlantis'],
+        ['Atlantis']
+    ])
+    def test_filter_data_by_countries(self, gappy_df, countries):
+        """Test the category-code lookup against isin"""
+        filtered = filter_data_by_countries(gappy_df, countries)
+        
+        expected = gappy_df[gappy_df['Country'].isin(countries)]
+        pd.testing.assert_frame_equal(filtered, expected)
+    
+    def test_filter_data_by_countries_no_selection(self, gappy_df):
+        """Test that an empty selection keeps every row"""
+        assert filter_data_by_countries(gappy_df, []) is gappy_df
+    
+    @pytest.mark.parametrize('countries, start, end', [
+        (['Benin', 'Sierra Leone', 'Togo'], '2021-08-10', '2021-11-01'),
+        (['Togo', 'Benin'], '2021-10-26 13:00', '2021-10-28'),
+        (['Togo', 'Atlantis'], '2021-10-26', '2021-10-29'),
+        (['Togo'], '2021-08-09', '2021-08-11'),
+        (['Atlantis'], '2021-08-09', '2021-12-31')
+    ])
+    def test_filter_data_by_date_range(self, gappy_df, countries, start, end):
+        """Test the searchsorted slices against a boolean mask"""
+        start, end = pd.Timestamp(start), pd.Timestamp(end)
+        
+        filtered = filter_data_by_date_range(gappy_df, countries, start, end)
+        
+        mask = (
+            gappy_df['Country'].isin(countries) &
+            (gappy_df['Timestamp'] >= start) &
+            (gappy_df['Timestamp'] < end)
+        )
+        expected = gappy_df[mask]
+        # Rows come back in selection order, not frame order
+        pd.testing.assert_frame_equal(filtered.sort_index(), expected)
+
+
+class TestComputeDailyGhi:
+    """Test cases for compute_daily_ghi"""
+    
+    def test_matches_resample(self, gappy_df):
+        """Test the reduceat daily means against groupby().resample('D')"""
+        daily = compute_daily_ghi(gappy_df)
+        
+        expected = (
+            gappy_df.groupby('Country', observed=True)
+            .resample('D', on='Timestamp')['GHI'].mean()
+            .reset_index()
+        )
+        assert daily['Country'].tolist() == expected['Country'].tolist()
+        assert (daily['Timestamp'].values == expected['Timestamp'].values).all()
+        np.testing.assert_allclose(daily['GHI'], expected['GHI'])
+        # All-missing and missing days are NaN
+        assert daily['GHI'].isna().sum() == 2
+    
+    def test_empty_frame(self, gappy_df):
+        """Test that an empty frame gives an empty aggregate"""
+        daily = compute_daily_ghi(gappy_df.iloc[:0])
+        
+        assert len(daily) == 0
+        assert list(daily.columns) == ['Country', 'Timestamp', 'GHI']
+
+
+class TestCreateSummaryTable:
+    """Test cases for create_summary_table"""
+    
+    @pytest.mark.parametrize('countries', [
+        ['Benin', 'Sierra Leone', 'Togo'],
+        ['Togo', 'Benin']
+    ])
+    def test_matches_groupby(self, gappy_df, countries):
+        """Test the reduceat summary against groupby().agg"""
+        df = filter_data_by_countries(gappy_df, countries)
+        
+        pd.testing.assert_frame_equal(
+            create_summary_table(df), _pandas_summary(df), check_dtype=False
+        )
+    
+    def test_unsorted_frame(self, gappy_df):
+        """Test a frame whose countries are not in contiguous blocks"""
+        df = gappy_df.sample(frac=1, random_state=0)
+        
+        pd.testing.assert_frame_equal(
+            create_summary_table(df), _pandas_summary(df), check_dtype=False
+        )
+    
+    def test_missing_timestamps(self, gappy_df):
+        """Test that rows without a timestamp don't count as dates or records"""
+        df = gappy_df.copy()
+        df.loc[[0, 450], 'Timestamp'] = pd.NaT
+        
+        summary = create_summary_table(df)
+        
+        pd.testing.assert_frame_equal(summary, _pandas_summary(df), check_dtype=False)
+        assert summary['Start Date'].notna().all()
+        assert summary['End Date'].notna().all()
+    
+    def test_empty_selection(self, gappy_df):
+        """Test that an empty selection gives an empty table"""
+        summary = create_summary_table(filter_data_by_countries(gappy_df, ['Atlantis']))
+        
+        assert len(summary) == 0
+        assert summary.columns[0] == 'Country'
+        assert summary.columns[-1] == 'Records'
+
+
+class TestLttbIndices:
+    """Test cases for lttb_indices"""
+    
+    def test_matches_reference(self):
+        """Test the vectorized buckets against a plain-Python LTTB"""
+        np.random.seed(0)
+        x = pd.date_range('2021-08-09', periods=5000, freq='min').values
+        y = np.cumsum(np.random.normal(0, 1, 5000))
+        
+        keep = lttb_indices(x, y, n_out=300)
+        
+        expected = _reference_lttb(x.view(np.int64).astype(np.float64), y, 300)
+        np.testing.assert_array_equal(keep, expected)
+    
+    def test_ignores_nans(self):
+        """Test that NaN points are skipped and never selected"""
+        np.random.seed(0)
+        x = np.arange(2000, dtype=np.float64)
+        y = np.random.normal(0, 1, 2000)
+        y[::7] = np.nan
+        
+        keep = lttb_indices(x, y, n_out=100)
+        
+        valid = np.flatnonzero(~np.isnan(y))
+        expected = valid[_reference_lttb(x[valid], y[valid], 100)]
+        np.testing.assert_array_equal(keep, expected)
+    
+    def test_short_input(self):
+        """Test that traces with at most n_out points are kept whole"""
+        y = np.array([1.0, np.nan, 3.0])
+        
+        np.testing.assert_array_equal(lttb_indices(np.arange(3), y, n_out=5), [0, 1, 2])
+        assert len(lttb_indices([], [], n_out=5)) == 0
@@ -5,6 +5,7 @@ Unit tests for data_cleaner module
 import pytest
 import pandas as pd
 import numpy as np
+from src import data_cleaner
 from src.data_cleaner import SolarDataCleaner, clean_solar_data
 
 
@@ -49,6 +50,34 @@ class TestSolarDataCleaner:
         
         assert df_imputed['GHI'].isna().sum() == 0
     
+    def test_impute_missing_values_mean_and_mode(self, sample_df):
+        """Test mean and mode imputation across several columns"""
+        sample_df.loc[0:10, 'DHI'] = np.nan
+        expected_mean = sample_df['GHI'].mean()
+        
+        cleaner = SolarDataCleaner(sample_df)
+        df_imputed = cleaner.impute_missing_values(columns=['GHI', 'DHI'], method='mean')
+        
+        assert df_imputed[['GHI', 'DHI']].isna().sum().sum() == 0
+        assert df_imputed.loc[0, 'GHI'] == pytest.approx(expected_mean)
+        
+        df_mode = SolarDataCleaner(pd.DataFrame({'A': [1.0, 1.0, 2.0, np.nan]}))
+        assert df_mode.impute_missing_values(method='mode')['A'].tolist() == [1.0, 1.0, 2.0, 1.0]
+    
+    def test_impute_missing_values_mixed_dtypes(self):
+        """Test median imputation of float32 and nullable integer columns"""
+        df = pd.DataFrame({
+            'A': np.array([np.nan, 2.0, 2.0, 4.0], dtype='float32'),
+            'B': pd.array([1, None, 3, 3], dtype='Int64')
+        })
+        
+        df_imputed = SolarDataCleaner(df).impute_missing_values(method='median')
+        
+        assert df_imputed['A'].tolist() == [2.0, 2.0, 2.0, 4.0]
+        assert df_imputed['B'].tolist() == [1, 3, 3, 3]
+        assert df_imputed['A'].dtype == np.float32
+        assert df.isna().sum().sum() == 2
+    
     def test_detect_outliers(self, sample_df):
         """Test outlier detection"""
         cleaner = SolarDataCleaner(sample_df)
@@ -58,6 +87,15 @@ class TestSolarDataCleaner:
         assert 'Outlier_Flag' in df_with_flags.columns
         assert df_with_flags['Outlier_Flag'].sum() > 0  # Should detect outliers
     
+    def test_detect_outliers_ignores_missing_values(self, sample_df):
+        """Test that missing values don't prevent outlier detection"""
+        sample_df.loc[0:10, 'DNI'] = np.nan
+        cleaner = SolarDataCleaner(sample_df)
+        df_with_flags = cleaner.detect_outliers(['DNI'], z_threshold=3.0)
+        
+        assert df_with_flags.loc[100:105, 'Outlier_Flag'].all()
+        assert not df_with_flags.loc[0:10, 'Outlier_Flag'].any()
+    
     def test_cap_outliers(self, sample_df):
         """Test outlier capping"""
         cleaner = SolarDataCleaner(sample_df)
@@ -74,6 +112,42 @@ class TestSolarDataCleaner:
         assert max_value <= mean + 3 * std
         assert min_value >= mean - 3 * std
     
+    def test_cap_outliers_keeps_detected_flags(self, sample_df):
+        """Test that capping other columns keeps flags from detect_outliers"""
+        sample_df.loc[200:203, 'Tamb'] = 100
+        cleaner = SolarDataCleaner(sample_df)
+        
+        detected = cleaner.detect_outliers(['DNI'])['Outlier_Flag'].copy()
+        df_capped = cleaner.cap_outliers(['Tamb'])
+        
+        assert df_capped.loc[detected, 'Outlier_Flag'].all()
+        assert df_capped.loc[200:203, 'Outlier_Flag'].all()
+        assert df_capped['Outlier_Flag'].sum() > detected.sum()
+    
+    def test_numba_kernel_matches_numpy(self, sample_df):
+        """Test that the Numba outlier kernel matches the NumPy one"""
+        numba = pytest.importorskip('numba')
+        mean_std_numba, flag_and_cap_numba = data_cleaner._build_numba_kernels(numba)
+        values = sample_df['GHI'].to_numpy(dtype=np.float64)
+        
+        # Rows already flagged by an earlier column, some of them outliers here
+        flagged = values > np.nanpercentile(values, 99)
+        
+        mean, std = mean_std_numba(values)
+        assert (mean, std) == pytest.approx(data_cleaner._mean_std_numpy(values))
+        
+        results = []
+        for kernel in (flag_and_cap_numba, data_cleaner._flag_and_cap_numpy):
+            out = np.empty_like(values)
+            flag = flagged.copy()
+            counts = kernel(values, mean - 2 * std, mean + 2 * std, out, flag)
+            results.append((out, flag, counts))
+        
+        np.testing.assert_allclose(results[0][0], results[1][0])
+        np.testing.assert_array_equal(results[0][1], results[1][1])
+        assert results[0][2] == results[1][2]
+        assert results[0][2][0] > results[0][2][1] > 0
+    
     def test_complete_clean_pipeline(self, sample_df):
         """Test complete cleaning pipeline"""
         cleaner = SolarDataCleaner(sample_df)
@@ -86,6 +160,58 @@ class TestSolarDataCleaner:
         assert df_cleaned is not None
         assert df_cleaned['GHI'].isna().sum() == 0
         assert 'Outlier_Flag' in df_cleaned.columns or cleaner.df_cleaned is not None
+        assert cleaner.get_cleaning_report()['total_outliers'] == df_cleaned['Outlier_Flag'].sum()
+    
+    def test_cap_outliers_skips_constant_columns(self, sample_df):
+        """Test that constant and all-missing columns are left untouched"""
+        sample_df['Cleaning'] = 0
+        sample_df['Empty'] = np.nan
+        cleaner = SolarDataCleaner(sample_df)
+        
+        df_capped = cleaner.cap_outliers(['DNI', 'Cleaning', 'Empty'])
+        
+        assert df_capped['Cleaning'].dtype == sample_df['Cleaning'].dtype
+        assert df_capped['Empty'].isna().all()
+        assert cleaner.outlier_flags['Cleaning']['count'] == 0
+        assert cleaner.outlier_flags['Empty']['count'] == 0
+        assert cleaner.outlier_flags['DNI']['count'] > 0
+    
+    def test_cap_outliers_keeps_dtypes(self, sample_df):
+        """Test capping of integer and nullable columns"""
+        sample_df['Cleaning'] = np.r_[np.zeros(900, dtype=int), np.ones(100, dtype=int)]
+        sample_df['GHI'] = sample_df['GHI'].astype('Float64')
+        sample_df.loc[200, 'GHI'] = 5000
+        cleaner = SolarDataCleaner(sample_df)
+        
+        df_cleaned = cleaner.clean(outlier_columns=['GHI', 'Cleaning'], z_threshold=3.5)
+        
+        # Cleaning has nothing to cap at this threshold and keeps its dtype
+        assert df_cleaned['Cleaning'].dtype == np.int64
+        assert df_cleaned['GHI'].dtype == 'Float64'
+        assert df_cleaned.loc[200, 'GHI'] < 5000
+    
+    def test_clean_does_not_modify_input(self, sample_df):
+        """Test that cleaning works on a private copy of the input"""
+        original = sample_df.copy()
+        cleaner = SolarDataCleaner(sample_df)
+        cleaner.clean(outlier_columns=['GHI', 'DNI'])
+        
+        pd.testing.assert_frame_equal(sample_df, original)
+    
+    def test_clean_without_copy(self, sample_df):
+        """Test that copy=False cleans the input dataframe itself"""
+        ghi = sample_df['GHI'].to_numpy(copy=False)
+        dni = sample_df['DNI'].to_numpy(copy=False)
+        cleaner = SolarDataCleaner(sample_df, copy=False)
+        df_cleaned = cleaner.clean(outlier_columns=['DNI'])
+        
+        assert df_cleaned is sample_df
+        assert sample_df['GHI'].isna().sum() == 0
+        assert 'Outlier_Flag' in sample_df.columns
+        # Buffers the cleaner doesn't own are replaced, not written into
+        assert np.isnan(ghi[:11]).all()
+        assert (dni[100:106] == 1000).all()
+        assert (sample_df['DNI'] < 1000).all()
 
 
 class TestCleanSolarDataFunction:
@@ -110,3 +236,27 @@ class TestCleanSolarDataFunction:
         assert 'missing_values' in report
         assert 'outliers' in report
 
+    
+    def test_clean_solar_data_polars_engine(self):
+        """Test that the polars engine matches the pandas pipeline"""
+        pytest.importorskip('polars')
+        np.random.seed(42)
+        df = pd.DataFrame({
+            'GHI': np.random.normal(240, 50, 100),
+            'DNI': np.random.normal(167, 40, 100),
+            'Tamb': np.random.randint(20, 40, 100)
+        })
+        df.loc[0:5, 'GHI'] = np.nan
+        df.loc[10, 'DNI'] = 2000
+        
+        expected, expected_report = clean_solar_data(df)
+        df_cleaned, report = clean_solar_data(df, engine='polars')
+        
+        pd.testing.assert_frame_equal(df_cleaned, expected)
+        assert report['outliers'] == expected_report['outliers']
+        assert report['total_outliers'] == expected_report['total_outliers']
+    
+    def test_clean_solar_data_unknown_engine(self):
+        """Test that an unknown engine is rejected"""
+        with pytest.raises(ValueError):
+            clean_solar_data(pd.DataFrame({'GHI': [1.0, 2.0]}), engine='spark')
@@ -0,0 +1,91 @@
+"""
+Unit tests for data_exporter module
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+from src.data_exporter import SolarDataExporter, export_cleaned_data
+
+
+class TestSolarDataExporter:
+    """Test cases for SolarDataExporter class"""
+    
+    @pytest.fixture
+    def sample_df(self):
+        """Create sample dataframe for testing"""
+        np.random.seed(42)
+        return pd.DataFrame({
+            'Timestamp': pd.date_range('2021-08-09', periods=10, freq='min'),
+            'GHI': np.random.rand(10) * 100,
+            'Tamb': np.arange(20.0, 30.0),
+            'Cleaning': np.zeros(10, dtype=int),
+            'Hour': np.arange(10),
+            'Outlier_Flag': np.zeros(10, dtype=bool)
+        })
+    
+    def test_export_csv_round_trip(self, sample_df, tmp_path):
+        """Test that an exported CSV reads back as the cleaned data"""
+        output_file = SolarDataExporter(sample_df).export(tmp_path / 'out.csv')
+        
+        exported = pd.read_csv(output_file, parse_dates=['Timestamp'])
+        expected = sample_df.drop(columns=['Hour', 'Outlier_Flag'])
+        pd.testing.assert_frame_equal(exported, expected)
+        # Whole-number floats keep their float dtype
+        assert exported['Tamb'].dtype == np.float64
+        assert output_file.read_text().splitlines()[0] == 'Timestamp,GHI,Tamb,Cleaning'
+    
+    def test_export_parquet_round_trip(self, sample_df, tmp_path):
+        """Test that an exported Parquet file reads back as the cleaned data"""
+        pytest.importorskip('pyarrow')
+        output_file = SolarDataExporter(sample_df).export(tmp_path / 'out.parquet', format='parquet')
+        
+        exported = pd.read_parquet(output_file)
+        pd.testing.assert_frame_equal(exported, sample_df.drop(columns=['Hour', 'Outlier_Flag']))
+    
+    def test_export_with_index(self, sample_df, tmp_path):
+        """Test that the index is written as the first CSV column"""
+        sample_df.index = pd.RangeIndex(100, 110, name='row')
+        output_file = SolarDataExporter(sample_df).export(tmp_path / 'out.csv', index=True)
+        
+        assert output_file.read_text().splitlines()[0] == 'row,Timestamp,GHI,Tamb,Cleaning'
+        exported = pd.read_csv(output_file, index_col='row')
+        assert exported.index.tolist() == list(range(100, 110))
+    
+    def test_export_keeps_temp_columns_in_dataframe(self, sample_df, tmp_path):
+        """Test that temporary columns are left out of the file only"""
+        exporter = SolarDataExporter(sample_df)
+        output_file = exporter.export(tmp_path / 'out.csv', temp_columns=['Hour'])
+        
+        header = output_file.read_text().splitlines()[0]
+        assert header == 'Timestamp,GHI,Tamb,Cleaning,Outlier_Flag'
+        assert 'Hour' in exporter.df.columns
+        
+        output_file = exporter.export(tmp_path / 'all.csv', remove_temp=False)
+        assert list(pd.read_csv(output_file).columns) == list(sample_df.columns)
+    
+    def test_export_mixed_type_column(self, tmp_path):
+        """Test exporting an object column holding mixed types"""
+        df = pd.DataFrame({'GHI': [1.0, 2.0, 3.0, 4.0], 'Note': [1, 'a', 2.5, None]})
+        
+        output_file = SolarDataExporter(df).export(tmp_path / 'out.csv')
+        
+        assert pd.read_csv(output_file)['Note'].tolist()[:3] == ['1', 'a', '2.5']
+    
+    def test_export_unknown_format(self, sample_df, tmp_path):
+        """Test that an unknown format is rejected"""
+        with pytest.raises(ValueError):
+            SolarDataExporter(sample_df).export(tmp_path / 'out.json', format='json')
+
+
+class TestExportCleanedDataFunction:
+    """Test cases for export_cleaned_data convenience function"""
+    
+    def test_export_cleaned_data_function(self, tmp_path):
+        """Test convenience function"""
+        df = pd.DataFrame({'GHI': [1.0, 2.0], 'Month': [8, 8]})
+        
+        output_file = export_cleaned_data(df, tmp_path / 'nested' / 'out.csv')
+        
+        assert output_file.exists()
+        assert list(pd.read_csv(output_file).columns) == ['GHI']
@@ -43,6 +43,70 @@ class TestSolarDataLoader:
         assert len(loaded_df) == 10
         assert pd.api.types.is_datetime64_any_dtype(loaded_df['Timestamp'])
     
+    def test_load_non_iso_timestamps(self, tmp_path):
+        """Test that timestamps the CSV reader leaves as text are still parsed"""
+        test_file = tmp_path / "test_data.csv"
+        test_file.write_text(
+            "Timestamp,GHI\n"
+            "08/09/2021 00:01,1.5\n"
+            "08/09/2021 00:02,2.5\n"
+        )
+        
+        loaded_df = SolarDataLoader(test_file).load()
+        
+        assert loaded_df['Timestamp'].dtype == 'datetime64[ns]'
+        assert loaded_df['Timestamp'].iloc[1] == pd.Timestamp('2021-08-09 00:02')
+        
+        # Day-first text only parses correctly with an explicit format
+        loaded_df = SolarDataLoader(test_file).load(timestamp_format='%d/%m/%Y %H:%M')
+        assert loaded_df['Timestamp'].iloc[1] == pd.Timestamp('2021-09-08 00:02')
+    
+    def test_load_timezone_aware_timestamps(self, tmp_path):
+        """Test that ISO timestamps with a UTC offset stay timezone-aware"""
+        test_file = tmp_path / "test_data.csv"
+        test_file.write_text(
+            "Timestamp,GHI\n"
+            "2021-08-09T00:01:00Z,1.5\n"
+            "2021-08-09T00:02:00Z,2.5\n"
+        )
+        
+        loaded_df = SolarDataLoader(test_file).load()
+        
+        assert loaded_df['Timestamp'].dtype == 'datetime64[ns, UTC]'
+        assert loaded_df['Timestamp'].iloc[1] == pd.Timestamp('2021-08-09 00:02', tz='UTC')
+    
+    def test_load_float32(self, tmp_path):
+        """Test loading float columns as float32"""
+        test_file = tmp_path / "test_data.csv"
+        df = pd.DataFrame({
+            'Timestamp': pd.date_range('2021-01-01', periods=10, freq='H'),
+            'GHI': np.random.rand(10) * 100,
+            'Cleaning': np.zeros(10, dtype=int)
+        })
+        df.to_csv(test_file, index=False)
+        
+        loaded_df = SolarDataLoader(test_file).load(dtype='float32')
+        
+        assert loaded_df['GHI'].dtype == np.float32
+        assert loaded_df['Cleaning'].dtype == np.int64
+        np.testing.assert_allclose(loaded_df['GHI'], df['GHI'], rtol=1e-6)
+    
+    def test_load_selected_columns(self, tmp_path):
+        """Test reading only some columns"""
+        test_file = tmp_path / "test_data.csv"
+        df = pd.DataFrame({
+            'Timestamp': pd.date_range('2021-01-01', periods=10, freq='H'),
+            'GHI': np.random.rand(10) * 100,
+            'DNI': np.random.rand(10) * 100,
+            'Comments': ['ok'] * 10
+        })
+        df.to_csv(test_file, index=False)
+        
+        loaded_df = SolarDataLoader(test_file).load(columns=['GHI'])
+        
+        assert list(loaded_df.columns) == ['Timestamp', 'GHI']
+        assert pd.api.types.is_datetime64_any_dtype(loaded_df['Timestamp'])
+    
     def test_set_time_index(self, tmp_path):
         """Test setting timestamp as index"""
         test_file = tmp_path / "test_data.csv"